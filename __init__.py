@@ -1,25 +1,86 @@
+# ruff: noqa: E402
+# The clock starts before the other imports so that the integration's own
+# import time can be reported in its startup profile.
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.config_entry_oauth2_flow import (
     ImplementationUnavailableError,
     OAuth2Session,
     async_get_config_entry_implementation,
 )
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
 
 from . import const as C
+from .api import API_URL, FordAPI
 from .const import DOMAIN
-from .coordinator import MyDataCoordinator
+from .ratelimit import AccountLimiter
+from .scheduler import phase_offset
+from .services import async_setup_services
+from .token_manager import TokenManager
+
+if TYPE_CHECKING:
+    from .coordinator import MyDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+IMPORT_TIME = time.perf_counter() - _IMPORT_STARTED
+
 
-CONFIG_SCHEMA = vol.Schema({C.DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        C.DOMAIN: vol.Schema(
+            {
+                # Directories holding one <vin>.jsonl telemetry trace per
+                # vehicle; see replay.py.
+                vol.Optional(C.CONF_RECORD): cv.string,
+                vol.Optional(C.CONF_REPLAY): cv.string,
+                # 1.0 is real time, 0 replays as fast as possible.
+                vol.Optional(C.CONF_REPLAY_SPEED, default=1.0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0)
+                ),
+                # Decode telemetry as it arrives, keeping only the metrics
+                # the integration reads; see streaming.py. Memory stays flat
+                # on large bodies, at several times the decode time.
+                vol.Optional(C.CONF_STREAM_DECODE, default=False): cv.boolean,
+                # Base URL of the Query API, e.g. a local stand-in for load
+                # and failure testing.
+                vol.Optional(C.CONF_API_URL): cv.url,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+PLATFORMS = [
+    "binary_sensor",
+    "sensor",
+    "lock",
+    "device_tracker",
+]
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    hass.data.setdefault(DOMAIN, {})["config"] = config.get(DOMAIN, {})
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
+    # Seconds spent in each setup phase, reported in diagnostics.
+    startup = {"import": IMPORT_TIME}
+    started = time.perf_counter()
     try:
         implementation = await async_get_config_entry_implementation(hass, entry)
     except ImplementationUnavailableError as err:
@@ -28,25 +89,110 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             translation_key="oauth2_implementation_unavailable",
         ) from err
 
-    _LOGGER.info("Setting up FordConnect entry with data: %s", str(entry.data))
+    startup["implementation_lookup"] = time.perf_counter() - started
+
     session = OAuth2Session(hass, entry, implementation)
     vin = entry.data[C.VIN]
-
-    coordinator = MyDataCoordinator(hass, session, entry)
+    if entry.unique_id is None:
+        hass.config_entries.async_update_entry(entry, unique_id=vin)
 
     hass.data.setdefault(DOMAIN, {})
 
+    # Entries authorized through the same application credential share one
+    # limiter, since that is what Ford's quota is counted against.
+    limiter = (
+        hass.data[DOMAIN]
+        .setdefault("limiters", {})
+        .setdefault(entry.data["auth_implementation"], AccountLimiter())
+    )
+
+    config = hass.data[DOMAIN].get("config", {})
+    api = FordAPI(
+        async_get_clientsession(hass),
+        session.token["access_token"],
+        config.get(C.CONF_API_URL, API_URL),
+    )
+    tokens = TokenManager(hass, session, api, phase_offset(vin))
+    entry.async_on_unload(tokens.async_start())
+
+    # The coordinator, with the statistics, trip and tire modules it
+    # brings along, is only imported once there is an entry to set up, and
+    # the trace support only when recording or replaying.
+    started = time.perf_counter()
+    coordinators = await async_import_module(hass, f"{__name__}.coordinator")
+    if C.CONF_RECORD in config or C.CONF_REPLAY in config:
+        replay = await async_import_module(hass, f"{__name__}.replay")
+    startup["coordinator_import"] = time.perf_counter() - started
+
+    api.stream_decode = config.get(C.CONF_STREAM_DECODE, False)
+    if C.CONF_RECORD in config:
+        recorder = replay.TraceRecorder(
+            hass, Path(hass.config.path(config[C.CONF_RECORD], f"{vin}.jsonl"))
+        )
+        api.on_response = recorder.record
+
+    coordinator: MyDataCoordinator
+    if C.CONF_REPLAY in config:
+        coordinator = replay.ReplayCoordinator(
+            hass,
+            tokens,
+            api,
+            limiter,
+            entry,
+            Path(hass.config.path(config[C.CONF_REPLAY], f"{vin}.jsonl")),
+            config[C.CONF_REPLAY_SPEED],
+        )
+    else:
+        coordinator = coordinators.MyDataCoordinator(
+            hass, tokens, api, limiter, entry
+        )
+
+    entry.async_on_unload(coordinator.statistics.async_start())
+
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
+        "api": api,
+        "tokens": tokens,
+        "limiter": limiter,
         "vin": vin,
+        "startup": startup,
     }
 
-    await hass.config_entries.async_forward_entry_setups(
-        entry,
-        [
-            "sensor",
-            "lock",
-            "device_tracker",
-        ],
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    started = time.perf_counter()
+    await coordinator.async_load_snapshot()
+    startup["snapshot_load"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    startup["platform_forwarding"] = time.perf_counter() - started
+
+    _LOGGER.debug(
+        "Startup profile: %s",
+        ", ".join(f"{phase} {sec * 1000:.1f} ms" for phase, sec in startup.items()),
+    )
+
+    # Entities start from the restored snapshot; fetch live data without
+    # holding up the rest of Home Assistant's startup.
+    entry.async_create_background_task(
+        hass, coordinator.async_first_refresh_spread(), "fordconnect first refresh"
     )
     return True
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    coordinator: MyDataCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator.update_poll_limits()
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id)
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    coordinators = await async_import_module(hass, f"{__name__}.coordinator")
+    await coordinators.async_remove_stores(hass, entry.entry_id)
@@ -1,27 +1,193 @@
-from typing import TypedDict, cast
-from httpx import AsyncClient
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import time
+from typing import Any, TypedDict, cast
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, hdrs
+from aiohttp.compression_utils import HAS_BROTLI
+from homeassistant.util.json import json_loads
 
-from .model import VehicleData, parse_api_response
+from .model import USED_METRICS, VehicleData, parse_api_response
+from .streaming import MetricStreamDecoder
+
+API_URL = "https://api.vehicle.ford.com/fcon-query/v1"
+
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+REQUEST_TIMEOUT = ClientTimeout(total=30)
 
 
 class Garage(TypedDict):
     vin: str
 
 
+@dataclass
+class FetchStats:
+    """Counters for telemetry fetches, for verifying what a poll costs."""
+
+    requests: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    last_bytes: int = 0
+    total_bytes: int = 0
+    last_parse_time: float = 0.0
+    total_parse_time: float = 0.0
+
+
+def _collect_stamps(item: Any, stamps: list[Any]) -> bool:
+    """Append the update timestamps of a metric; False if a value has none.
+
+    Metrics such as configurations and customMetrics are maps of
+    sub-metrics, each with its own timestamp.
+    """
+    if isinstance(item, list):
+        return all(_collect_stamps(entry, stamps) for entry in item)
+    if not isinstance(item, dict) or not item:
+        return False
+    if (stamp := item.get("updateTime")) is not None:
+        stamps.append(stamp)
+        return True
+    return all(_collect_stamps(value, stamps) for value in item.values())
+
+
+def _metrics_fingerprint(metrics: dict[str, Any]) -> tuple[Any, ...] | None:
+    """Collect the update timestamps the API reports for each metric.
+
+    Returns None unless every metric, or each of its sub-metrics, carries
+    one, as values can then change without the fingerprint changing.
+    """
+    stamps: list[Any] = []
+    if not all(_collect_stamps(metric, stamps) for metric in metrics.values()):
+        return None
+    return tuple(stamps) if stamps else None
+
+
 class FordAPI:
-    def __init__(self, access_token: str) -> None:
-        self._access_token = access_token
-        self._client = AsyncClient(headers={"Authorization": f"Bearer {access_token}"})
+    """Ford Connect Query client on top of a long-lived aiohttp session.
+
+    The session (and its keep-alive connection pool) is injected and outlives
+    individual polls; only the bearer token is swapped when it is refreshed.
+    """
+
+    def __init__(
+        self, websession: ClientSession, access_token: str, base_url: str = API_URL
+    ) -> None:
+        self._websession = websession
+        self._base_url = base_url.rstrip("/")
+        self._headers: dict[str, str] = {}
+        self._validators: dict[str, str] = {}
+        self._fingerprint: tuple[Any, ...] | None = None
+        self.stats = FetchStats()
+        # Called with every raw telemetry body, e.g. to record a trace.
+        self.on_response: Callable[[bytes], None] | None = None
+        # Decode bodies incrementally, keeping only the metrics the parser
+        # reads. Recording needs whole bodies and falls back to buffering.
+        self.stream_decode = False
+        self.set_access_token(access_token)
+
+    def set_access_token(self, access_token: str) -> None:
+        self._headers = {
+            hdrs.AUTHORIZATION: f"Bearer {access_token}",
+            hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING,
+        }
 
     async def get_garage(self) -> Garage:
-        r = await self._client.get("https://api.vehicle.ford.com/fcon-query/v1/garage")
-        r.raise_for_status()
-        return cast(Garage, r.json())
-
-    async def get_telemetry(self) -> VehicleData:
-        r = await self._client.get(
-            "https://api.vehicle.ford.com/fcon-query/v1/telemetry"
-        )
-        r.raise_for_status()
-        data = r.json()
-        return parse_api_response(data)
+        async with self._websession.get(
+            f"{self._base_url}/garage", headers=self._headers, timeout=REQUEST_TIMEOUT
+        ) as r:
+            r.raise_for_status()
+            return cast(Garage, await r.json())
+
+    async def get_telemetry(
+        self, errors: list[str] | None = None
+    ) -> VehicleData | None:
+        """Fetch and parse telemetry.
+
+        Returns None when the snapshot has not changed since the previous
+        call, either because the server answered 304 to the ETag or
+        Last-Modified validators, or because every metric still carries the
+        same update timestamp. Parsing is skipped in both cases.
+        """
+        self.stats.requests += 1
+        async with self._websession.get(
+            f"{self._base_url}/telemetry",
+            headers={**self._headers, **self._validators},
+            timeout=REQUEST_TIMEOUT,
+        ) as r:
+            if r.status == 304:
+                self.stats.not_modified += 1
+                self.stats.last_bytes = 0
+                return None
+            r.raise_for_status()
+            self._update_validators(r.headers)
+            if self.stream_decode and self.on_response is None:
+                return await self._stream_telemetry(r, errors)
+            body = await r.read()
+            # Content-Length is the size on the wire, before decompression.
+            size = r.content_length if r.content_length is not None else len(body)
+
+        self._count_bytes(size)
+        if self.on_response is not None:
+            self.on_response(body)
+        return self.decode_telemetry(body, errors)
+
+    async def _stream_telemetry(
+        self, r: ClientResponse, errors: list[str] | None
+    ) -> VehicleData | None:
+        decoder = MetricStreamDecoder(USED_METRICS)
+        size = 0
+        decode_time = 0.0
+        # The rest of the body is still read once the metrics are complete,
+        # so that the connection can go back to the pool.
+        async for chunk in r.content.iter_any():
+            size += len(chunk)
+            start = time.perf_counter()
+            decoder.feed(chunk)
+            decode_time += time.perf_counter() - start
+        self._count_bytes(r.content_length if r.content_length is not None else size)
+        return self._parse_metrics(decoder.result(), errors, decode_time)
+
+    def _count_bytes(self, size: int) -> None:
+        self.stats.last_bytes = size
+        self.stats.total_bytes += size
+
+    def decode_telemetry(
+        self, body: bytes, errors: list[str] | None = None
+    ) -> VehicleData | None:
+        """Decode a raw telemetry body; None if its metrics are unchanged.
+
+        Raises ValueError if the body is not JSON with a metrics object.
+        """
+        start = time.perf_counter()
+        # orjson-backed, decodes straight from the response bytes.
+        data = json_loads(body)
+        decode_time = time.perf_counter() - start
+        if not isinstance(data, dict) or not isinstance(data.get("metrics"), dict):
+            raise ValueError("Telemetry body has no metrics object")
+        return self._parse_metrics(data["metrics"], errors, decode_time)
+
+    def _parse_metrics(
+        self,
+        metrics: dict[str, Any],
+        errors: list[str] | None,
+        decode_time: float,
+    ) -> VehicleData | None:
+        start = time.perf_counter()
+        fingerprint = _metrics_fingerprint(metrics)
+        vehicle_data = None
+        if fingerprint is not None and fingerprint == self._fingerprint:
+            self.stats.unchanged += 1
+        else:
+            vehicle_data = parse_api_response({"metrics": metrics}, errors)
+            self._fingerprint = fingerprint
+
+        self.stats.last_parse_time = decode_time + time.perf_counter() - start
+        self.stats.total_parse_time += self.stats.last_parse_time
+        return vehicle_data
+
+    def _update_validators(self, headers: Mapping[str, str]) -> None:
+        validators = {}
+        if etag := headers.get(hdrs.ETAG):
+            validators[hdrs.IF_NONE_MATCH] = etag
+        if last_modified := headers.get(hdrs.LAST_MODIFIED):
+            validators[hdrs.IF_MODIFIED_SINCE] = last_modified
+        self._validators = validators
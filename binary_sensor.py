@@ -0,0 +1,58 @@
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
+from . import const as C
+from .coordinator import MyDataCoordinator
+from .vehicle_entity import VehicleEntity
+
+_CORNERS = {
+    "front_left": "Front Left",
+    "front_right": "Front Right",
+    "rear_left": "Rear Left",
+    "rear_right": "Rear Right",
+}
+
+
+class TireProblemEntity(VehicleEntity, BinarySensorEntity):
+    """On while the tire monitor flags a problem with one wheel."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(
+        self, coordinator: MyDataCoordinator, entry: ConfigEntry, wheel: str
+    ) -> None:
+        self._wheel = wheel
+        self._data_paths = (
+            f"tires.{wheel}",
+            "outside_temperature",
+            "ambient_temp",
+        )
+        super().__init__(coordinator, entry)
+        self._attr_name = f"Tire Problem: {_CORNERS[wheel]}"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        monitor = self.coordinator.tires.wheels[self._wheel]
+        details = monitor.as_dict()
+        self._attr_is_on = bool(details["problems"])
+        self._attr_extra_state_attributes = details
+        self.async_write_ha_state()
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+) -> None:
+    data = hass.data[C.DOMAIN][entry.entry_id]
+    coordinator = data["coordinator"]
+    async_add_entities(
+        [TireProblemEntity(coordinator, entry, wheel) for wheel in _CORNERS],
+        update_before_add=False,
+    )
@@ -2,18 +2,38 @@ import logging
 from typing import Any
 from homeassistant.components.http import URL
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from aiohttp import web
-from homeassistant.config_entries import ConfigFlowResult
+from homeassistant.config_entries import (
+    SOURCE_REAUTH,
+    ConfigEntry,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_ACCESS_TOKEN, CONF_NAME, CONF_TOKEN
+from homeassistant.core import callback
 import secrets
+import voluptuous as vol
 
 from . import const as C
 
-from .api import FordAPI
+from .api import API_URL, FordAPI
 
 
 LOGGER = logging.getLogger(__name__)
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            C.CONF_MIN_INTERVAL, default=C.DEFAULT_MIN_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+        vol.Required(
+            C.CONF_MAX_INTERVAL, default=C.DEFAULT_MAX_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+        vol.Required(C.CONF_DEAD_RECKONING, default=False): bool,
+    }
+)
+
 
 class MyOAuthCallbackView(config_entry_oauth2_flow.OAuth2AuthorizeCallbackView):
     url = "/api/ford-oauth/callback"
@@ -47,10 +67,26 @@ class FordConnectConfigFlow(
 
     async def async_oauth_create_entry(self, data):
         access_token = data[CONF_TOKEN][CONF_ACCESS_TOKEN]
-        ford_api = FordAPI(access_token)
+        config = self.hass.data.get(C.DOMAIN, {}).get("config", {})
+        ford_api = FordAPI(
+            async_get_clientsession(self.hass),
+            access_token,
+            config.get(C.CONF_API_URL, API_URL),
+        )
 
         garage = await ford_api.get_garage()
 
+        # The Query API authorizes exactly one vehicle per token, so the VIN
+        # identifies the entry; a second authorization of the same car would
+        # only duplicate its polling and token refreshes.
+        await self.async_set_unique_id(garage["vin"])
+        if self.source == SOURCE_REAUTH:
+            self._abort_if_unique_id_mismatch(reason="wrong_vehicle")
+            return self.async_update_reload_and_abort(
+                self._get_reauth_entry(), data_updates=data
+            )
+        self._abort_if_unique_id_configured()
+
         return self.async_create_entry(
             title="Ford Query integration",
             data={**data, "vin": garage["vin"], CONF_NAME: "my-name"},
@@ -60,6 +96,11 @@ class FordConnectConfigFlow(
     def logger(self) -> logging.Logger:
         return LOGGER
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        return FordConnectOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         hass = self.hass
 
@@ -110,3 +151,23 @@ class FordConnectConfigFlow(
         return await self.async_step_pick_implementation(
             user_input={"implementation": reauth_entry.data["auth_implementation"]}
         )
+
+
+class FordConnectOptionsFlow(OptionsFlow):
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input[C.CONF_MIN_INTERVAL] > user_input[C.CONF_MAX_INTERVAL]:
+                errors["base"] = "min_above_max"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, user_input or self.config_entry.options
+            ),
+            errors=errors,
+        )
@@ -2,3 +2,16 @@
 
 VIN = "vin"
 DOMAIN = "fordconnect"
+
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_DEAD_RECKONING = "dead_reckoning"
+
+DEFAULT_MIN_INTERVAL = 15
+DEFAULT_MAX_INTERVAL = 600
+
+CONF_RECORD = "record"
+CONF_REPLAY = "replay"
+CONF_REPLAY_SPEED = "replay_speed"
+CONF_STREAM_DECODE = "stream_decode"
+CONF_API_URL = "api_url"
@@ -1,54 +1,206 @@
-from datetime import timedelta
-import json
+import asyncio
+from datetime import datetime, timedelta
 import logging
-from pathlib import Path
+import math
+import time
+from typing import Any
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-import httpx
+from homeassistant.util import dt as dt_util
+from aiohttp import ClientError, ClientResponseError
 
 from . import const as C
-from .model import VehicleData
+from .history import TrackHistory
+from .metrics import PollMetrics
+from .model import VehicleData, changed_paths
 from .api import FordAPI
+from .ratelimit import AccountLimiter, parse_retry_after
+from .scheduler import AdaptivePollScheduler, phase_offset
+from .statistics import StatisticsImporter
+from .tires import TireMonitor, tires_store
+from .trips import TripLog, trips_store
+from .token_manager import TokenManager
 
 LOGGER = logging.getLogger(__name__)  # noqa: F821
 
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
 
-class MyDataCoordinatorFromFile(DataUpdateCoordinator[VehicleData]):
-    def __init__(self, hass: HomeAssistant, vin: str, entry: ConfigEntry) -> None:
-        super().__init__(
-            hass,
-            LOGGER,
-            name=C.DOMAIN,
-            update_interval=timedelta(seconds=15),
-            config_entry=entry,
-            always_update=True,
-        )
-        self._vin = vin
+# Seconds after a poll during which requested refreshes reuse its result,
+# e.g. several automations calling update_entity on arrival. Scheduled
+# refreshes always poll.
+COALESCE_WINDOW = 5
 
-    async def _async_update_data(self):
-        LOGGER.info("Updating data for VIN: %s", self._vin)
 
-        data = json.loads((Path(__file__).parent / "parsed.json").read_text())
+class _Throttled(Exception):
+    """The account's own request budget is spent for ``wait`` seconds."""
+
+    def __init__(self, wait: float) -> None:
+        super().__init__(wait)
+        self.wait = wait
+
+
+def poll_limits(entry: ConfigEntry) -> tuple[timedelta, timedelta]:
+    return (
+        timedelta(
+            seconds=entry.options.get(C.CONF_MIN_INTERVAL, C.DEFAULT_MIN_INTERVAL)
+        ),
+        timedelta(
+            seconds=entry.options.get(C.CONF_MAX_INTERVAL, C.DEFAULT_MAX_INTERVAL)
+        ),
+    )
 
-        return data
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store persisting an entry's last telemetry snapshot."""
+    return Store(hass, SNAPSHOT_VERSION, f"{C.DOMAIN}.{entry_id}")
+
+
+async def async_remove_stores(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove everything persisted for a removed entry."""
+    await snapshot_store(hass, entry_id).async_remove()
+    await trips_store(hass, entry_id).async_remove()
+    await tires_store(hass, entry_id).async_remove()
 
 
 class MyDataCoordinator(DataUpdateCoordinator[VehicleData]):
+    coalesce_window: float = COALESCE_WINDOW
+
     def __init__(
-        self, hass: HomeAssistant, session: OAuth2Session, entry: ConfigEntry
+        self,
+        hass: HomeAssistant,
+        tokens: TokenManager,
+        api: FordAPI,
+        limiter: AccountLimiter,
+        entry: ConfigEntry,
     ) -> None:
+        self.scheduler = AdaptivePollScheduler(
+            *poll_limits(entry), phase=phase_offset(entry.data[C.VIN])
+        )
         super().__init__(
             hass,
             LOGGER,
             name=C.DOMAIN,
-            update_interval=timedelta(seconds=30),
+            update_interval=self.scheduler.current_interval,
             config_entry=entry,
             always_update=True,
         )
-        self._session = session
+        self._tokens = tokens
+        self._api = api
+        self._limiter = limiter
         self.last_update_success = False
+        self.skipped_writes = 0
+        self._notified_data: VehicleData | None = None
+        self._notified_success: bool | None = None
+        self.missing_fields: frozenset[str] = frozenset()
+        self._unchanged = False
+        self.metrics = PollMetrics(token_refresh_time=tokens.refresh_time)
+        self.history = TrackHistory()
+        self.statistics = StatisticsImporter(hass, entry.data[C.VIN])
+        self.trips = TripLog(hass, entry.entry_id)
+        self.tires = TireMonitor(hass, entry.entry_id)
+        # The poll in flight, and when the last one succeeded; refreshes
+        # requested meanwhile share its result.
+        self._poll_task: asyncio.Task[VehicleData | None] | None = None
+        self._polled_at = -math.inf
+        self._scheduled_refresh = False
+        self._store = snapshot_store(hass, entry.entry_id)
+        # When the current data was received, and whether it was restored
+        # from the stored snapshot rather than fetched since startup.
+        self.data_updated: datetime | None = None
+        self.restored = False
+
+    async def async_load_snapshot(self) -> None:
+        """Start from the last persisted telemetry, if there is any."""
+        await self.trips.async_load()
+        await self.tires.async_load()
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        try:
+            self.data = VehicleData.from_dict(stored["data"])
+        except (KeyError, TypeError):
+            # Saved by a version with different fields; the first poll
+            # replaces it anyway.
+            LOGGER.debug("Ignoring a stored snapshot that does not fit VehicleData")
+            return
+        if stored["updated"]:
+            self.data_updated = dt_util.parse_datetime(stored["updated"])
+        self.restored = True
+
+    async def async_first_refresh_spread(self) -> None:
+        """Run the first refresh, delayed by the entry's phase if it can wait.
+
+        Only entries that restored a snapshot wait, as they already have
+        data to show; a new entry refreshes straight away.
+        """
+        if self.restored:
+            await asyncio.sleep(self.scheduler.first_delay.total_seconds())
+        await self.async_refresh()
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        return {
+            "data": self.data.as_dict() if self.data is not None else None,
+            "updated": self.data_updated.isoformat() if self.data_updated else None,
+        }
+
+    def update_poll_limits(self) -> None:
+        """Apply changed interval options without reloading the entry."""
+        if self.config_entry:
+            self.scheduler.set_limits(*poll_limits(self.config_entry))
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Wake only the entities whose data paths changed.
+
+        Entities register the key paths they read as their coordinator
+        context. Listeners without a context, and every listener after a
+        change in availability, are always notified.
+        """
+        start = time.perf_counter()
+        try:
+            self._async_fan_out()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.fan_out_time.add(elapsed)
+        LOGGER.debug(
+            "Entity fan-out took %.2f ms, %d writes skipped so far",
+            elapsed * 1000,
+            self.skipped_writes,
+        )
+
+    @callback
+    def _async_fan_out(self) -> None:
+        unchanged, self._unchanged = self._unchanged, False
+        if self._notified_success is not self.last_update_success or (
+            not self.last_update_success
+        ):
+            self._notified_success = self.last_update_success
+            self._notified_data = self.data
+            super().async_update_listeners()
+            return
+
+        if unchanged:
+            changed: set[str] = set()
+        else:
+            previous, self._notified_data = self._notified_data, self.data
+            changed = changed_paths(previous, self.data)
+        for update_callback, context in list(self._listeners.values()):
+            if not context or not changed.isdisjoint(context):
+                update_callback()
+            else:
+                self.skipped_writes += 1
+
+    async def _async_refresh(
+        self, *args: Any, scheduled: bool = False, **kwargs: Any
+    ) -> None:
+        # Refreshes run one at a time under the debouncer's lock, so this
+        # tells _async_update_data what kind of refresh it is serving.
+        self._scheduled_refresh = scheduled
+        await super()._async_refresh(*args, scheduled=scheduled, **kwargs)
 
     async def _async_update_data(self):
         vin = None
@@ -57,12 +209,145 @@ class MyDataCoordinator(DataUpdateCoordinator[VehicleData]):
 
         LOGGER.info("Updating data for VIN: %s", vin)
 
-        await self._session.async_ensure_token_valid()
+        errors: list[str] = []
+        task = self._poll_task
+        recent = time.monotonic() - self._polled_at < self.coalesce_window
+        try:
+            if task is None and (self._scheduled_refresh or not recent):
+                task = self._poll_task = self.hass.async_create_task(
+                    self._async_poll(errors)
+                )
+                task.add_done_callback(self._poll_done)
+                # Shielded so a cancelled refresh does not cancel the shared
+                # poll.
+                data = await asyncio.shield(task)
+            else:
+                # Another refresh is polling, or a requested refresh comes
+                # right after a poll: share its result instead of spending
+                # another request.
+                self.metrics.merged_requests += 1
+                if task is not None:
+                    await asyncio.shield(task)
+                data = None
+        except _Throttled as err:
+            if self.data is None:
+                raise UpdateFailed(
+                    f"Ford API request budget spent for {err.wait:.0f} s",
+                    retry_after=err.wait,
+                ) from err
+            # Not a failure: keep the current data and poll again as soon
+            # as the budget allows.
+            LOGGER.debug("Poll skipped, request budget spent for %.1f s", err.wait)
+            self._unchanged = True
+            self.update_interval = timedelta(seconds=err.wait)
+            return self.data
+
+        if data is None:
+            # Nothing new since the last poll: keep the current snapshot and
+            # skip the entity fan-out.
+            self._unchanged = True
+            self.update_interval = self._next_update_interval(self.data)
+            return self.data
 
-        ford_api = FordAPI(self._session.token["access_token"])
+        self._report_missing_fields(errors)
+        self.history.add_fix(data)
+        self.data_updated = dt_util.utcnow()
+        self.statistics.add(data, self.data_updated)
+        self.trips.add(data, self.data_updated)
+        self.tires.add(data, self.data_updated.timestamp())
+        self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        self.update_interval = self._next_update_interval(data)
+        return data
 
+    async def _async_poll(self, errors: list[str]) -> VehicleData | None:
+        stats = self._api.stats
+        parse_total = stats.total_parse_time
+        started = time.perf_counter()
         try:
-            return await ford_api.get_telemetry()
-        except httpx.HTTPStatusError as err:
-            if err.response.status_code == 429:
-                raise UpdateFailed(retry_after=60) from err
+            data = await self._async_fetch(errors)
+        except UpdateFailed:
+            self.metrics.failed_polls += 1
+            raise
+        finally:
+            # From the first poll on, failed or not, the restored data is
+            # as available as polled data would be.
+            self.restored = False
+        self._polled_at = time.monotonic()
+
+        self.metrics.poll_time.add(time.perf_counter() - started)
+        self.metrics.response_size.add(stats.last_bytes)
+        if stats.total_parse_time != parse_total:
+            # Not on a 304, which has no body to decode.
+            self.metrics.parse_time.add(stats.last_parse_time)
+        self.metrics.last_success = dt_util.utcnow()
+        LOGGER.debug(
+            "Telemetry fetch: %d bytes, %.1f ms decode",
+            stats.last_bytes,
+            stats.last_parse_time * 1000,
+        )
+        return data
+
+    @callback
+    def _poll_done(self, task: asyncio.Task[VehicleData | None]) -> None:
+        self._poll_task = None
+        # A failed poll whose refresh was cancelled meanwhile, e.g. on
+        # unload, has nobody left to retrieve its exception.
+        if not task.cancelled():
+            task.exception()
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        self.statistics.flush()
+
+    def _next_update_interval(self, data: VehicleData | None) -> timedelta:
+        return self.scheduler.next_interval(data)
+
+    async def _async_fetch(self, errors: list[str]) -> VehicleData | None:
+        """Fetch telemetry from the API; None means nothing changed."""
+        await self._tokens.async_ensure_token_valid()
+
+        if (blocked_for := self._limiter.blocked_for()) > 0:
+            raise UpdateFailed(
+                f"Ford API requests are held back for {blocked_for:.0f} s",
+                retry_after=blocked_for,
+            )
+        if (throttled_for := self._limiter.throttled_for()) > 0:
+            raise _Throttled(throttled_for)
+        self._limiter.take()
+
+        try:
+            data = await self._api.get_telemetry(errors)
+        except ClientResponseError as err:
+            if err.status == 429:
+                self.metrics.rate_limited += 1
+                retry_after = self._limiter.record_rate_limited(
+                    parse_retry_after(err.headers)
+                )
+                raise UpdateFailed(
+                    "Rate limited by the Ford API", retry_after=retry_after
+                ) from err
+            if err.status >= 500:
+                raise UpdateFailed(
+                    f"Telemetry request failed: {err.status}",
+                    retry_after=self._limiter.record_failure() or None,
+                ) from err
+            raise UpdateFailed(f"Telemetry request failed: {err.status}") from err
+        except (TimeoutError, ClientError) as err:
+            raise UpdateFailed(
+                f"Telemetry request failed: {err!r}",
+                retry_after=self._limiter.record_failure() or None,
+            ) from err
+        except ValueError as err:
+            # A truncated or garbled body; the next poll usually reads fine.
+            raise UpdateFailed(f"Malformed telemetry: {err}") from err
+        self._limiter.record_success()
+        return data
+
+    def _report_missing_fields(self, errors: list[str]) -> None:
+        missing = frozenset(errors)
+        if missing - self.missing_fields:
+            LOGGER.warning(
+                "Telemetry is missing or has malformed fields: %s",
+                ", ".join(sorted(missing - self.missing_fields)),
+            )
+        self.missing_fields = missing
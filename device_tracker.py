@@ -1,24 +1,161 @@
+from datetime import datetime, timedelta
+import math
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.components.device_tracker import TrackerEntity
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 
 from . import const as C
+from .coordinator import MyDataCoordinator
 from .vehicle_entity import VehicleEntity
 
+EARTH_RADIUS = 6_371_000
+
+# Dead reckoning: how often the estimate moves, below which speed (km/h)
+# the vehicle counts as stopped, how long after a fix estimates are made,
+# and how much of the distance travelled since is added to the accuracy.
+ESTIMATE_INTERVAL = timedelta(seconds=5)
+ESTIMATE_MIN_SPEED = 3.0
+ESTIMATE_MAX_AGE = 60.0
+ESTIMATE_ERROR_RATE = 0.25
+
+
+def project(
+    latitude: float, longitude: float, heading: float, distance: float
+) -> tuple[float, float]:
+    """Move a position ``distance`` metres along ``heading`` degrees.
+
+    A flat-earth approximation, accurate to well under a metre over the
+    few hundred metres covered between two polls.
+    """
+    bearing = math.radians(heading)
+    north = distance * math.cos(bearing)
+    east = distance * math.sin(bearing)
+    return (
+        latitude + math.degrees(north / EARTH_RADIUS),
+        longitude
+        + math.degrees(east / (EARTH_RADIUS * math.cos(math.radians(latitude)))),
+    )
+
 
 class PositionEntity(VehicleEntity, TrackerEntity):
     _attr_has_entity_name = True
     _attr_name = "Vehicle Position"
+    _data_paths = ("position", "position_uncertainty", "heading", "speed")
+
+    def __init__(self, coordinator: MyDataCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        self._fix_time: datetime | None = None
+        self._fix: tuple[float, float] | None = None
+        self._fix_accuracy = 0.0
+        self._unsub_estimate: CALLBACK_TYPE | None = None
+        # Whether the last written state was available, so that a change in
+        # availability is written even without a new fix.
+        self._written_available: bool | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        _, lat, long, alt = self.coordinator.data["position"]
+        if self._update_fix():
+            self._update_estimates()
+        elif self.available is self._written_available:
+            # The same GPS fix as before, e.g. while parked.
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._written_available = self.available
+        super().async_write_ha_state()
+
+    @callback
+    def _update_fix(self) -> bool:
+        """Take the position from a new GPS fix; False if there is none."""
+        data = self.coordinator.data
+        position = data["position"]
+        if position is None:
+            return False
+        fix_time = dt_util.parse_datetime(position[0])
+        if (
+            fix_time is not None
+            and self._fix_time is not None
+            and fix_time <= self._fix_time
+        ):
+            return False
+        self._fix_time = fix_time
+
+        _, lat, long, alt = position
+        heading = data["heading"]
+        self._fix = (lat, long)
+        self._fix_accuracy = data.get("position_uncertainty") or 0.0
         self._attr_latitude = lat
         self._attr_longitude = long
         self._attr_altitude = alt
+        self._attr_location_accuracy = round(self._fix_accuracy)
+        self._attr_extra_state_attributes = {
+            "heading": heading[2] if heading else None,
+            "speed": data["speed"],
+            "estimated": False,
+        }
+        return True
+
+    @callback
+    def _update_estimates(self) -> None:
+        """Run the dead-reckoning timer only while it can move the position."""
+        attributes = self._attr_extra_state_attributes
+        moving = (
+            self._dead_reckoning
+            and self._fix_time is not None
+            and attributes["heading"] is not None
+            and (attributes["speed"] or 0.0) >= ESTIMATE_MIN_SPEED
+        )
+        if moving and self._unsub_estimate is None:
+            self._unsub_estimate = async_track_time_interval(
+                self.hass, self._async_estimate, ESTIMATE_INTERVAL
+            )
+        elif not moving:
+            self._cancel_estimates()
+
+    @property
+    def _dead_reckoning(self) -> bool:
+        return self._entry.options.get(C.CONF_DEAD_RECKONING, False)
+
+    @callback
+    def _cancel_estimates(self) -> None:
+        if self._unsub_estimate is not None:
+            self._unsub_estimate()
+            self._unsub_estimate = None
+
+    @callback
+    def _async_estimate(self, now: datetime) -> None:
+        assert self._fix_time is not None and self._fix is not None
+        if not self._dead_reckoning:
+            # Switched off in the options since the timer was started.
+            self._cancel_estimates()
+            return
+        age = (now - self._fix_time).total_seconds()
+        if age > ESTIMATE_MAX_AGE:
+            # Too long without a fix for the estimate to mean anything;
+            # stay at the last estimate until the next poll.
+            self._cancel_estimates()
+            return
+        attributes = self._attr_extra_state_attributes
+        distance = attributes["speed"] / 3.6 * max(0.0, age)
+        self._attr_latitude, self._attr_longitude = project(
+            *self._fix, attributes["heading"], distance
+        )
+        self._attr_location_accuracy = round(
+            self._fix_accuracy + distance * ESTIMATE_ERROR_RATE
+        )
+        self._attr_extra_state_attributes = {**attributes, "estimated": True}
         self.async_write_ha_state()
 
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_estimates()
+        await super().async_will_remove_from_hass()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
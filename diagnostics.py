@@ -0,0 +1,28 @@
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_TOKEN
+from homeassistant.core import HomeAssistant
+
+from . import const as C
+
+TO_REDACT = {CONF_TOKEN, C.VIN, "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    data = hass.data[C.DOMAIN][entry.entry_id]
+    coordinator = data["coordinator"]
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "rate_limiter": data["limiter"].as_dict(),
+        "startup": data["startup"],
+        "metrics": coordinator.metrics.as_dict(),
+        "fetch": asdict(data["api"].stats),
+        "token_refreshes": data["tokens"].refresh_count,
+        "skipped_writes": coordinator.skipped_writes,
+        "missing_fields": sorted(coordinator.missing_fields),
+    }
@@ -0,0 +1,98 @@
+from array import array
+import math
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .model import VehicleData
+
+DEFAULT_CAPACITY = 2048
+
+FIELDS = ("timestamp", "latitude", "longitude", "altitude", "speed", "heading")
+
+
+def _number(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+class TrackHistory:
+    """Bounded ring buffer of recent position fixes.
+
+    Every field lives in its own preallocated ``array('d')`` column, so the
+    buffer costs ``8 * len(FIELDS) * capacity`` bytes however long it runs.
+    Missing values are stored as NaN and returned as None.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._capacity = capacity
+        self._columns = {name: array("d", bytes(8 * capacity)) for name in FIELDS}
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> float | None:
+        if not self._size:
+            return None
+        return self._columns["timestamp"][self._index(self._size - 1)]
+
+    def _index(self, offset: int) -> int:
+        return (self._start + offset) % self._capacity
+
+    def append(self, values: dict[str, float]) -> None:
+        if self._size < self._capacity:
+            slot = self._index(self._size)
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self._capacity
+        for name, column in self._columns.items():
+            column[slot] = values[name]
+
+    def add_fix(self, data: VehicleData) -> bool:
+        """Store the position from a snapshot unless its GPS fix is not new."""
+        position = data["position"]
+        if position is None:
+            return False
+        gps_time = dt_util.parse_datetime(position[0])
+        if gps_time is None:
+            return False
+        timestamp = gps_time.timestamp()
+        last = self.last_timestamp
+        if last is not None and timestamp <= last:
+            return False
+
+        heading = data["heading"]
+        self.append(
+            {
+                "timestamp": timestamp,
+                "latitude": _number(position[1]),
+                "longitude": _number(position[2]),
+                "altitude": _number(position[3]),
+                "speed": _number(data["speed"]),
+                "heading": _number(heading[2] if heading else None),
+            }
+        )
+        return True
+
+    def recent(
+        self, limit: int | None = None, since: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the newest fixes, oldest first."""
+        count = self._size if limit is None else min(limit, self._size)
+        fixes: list[dict[str, Any]] = []
+        for offset in range(self._size - count, self._size):
+            slot = self._index(offset)
+            timestamp = self._columns["timestamp"][slot]
+            if since is not None and timestamp < since:
+                continue
+            fix: dict[str, Any] = {
+                "timestamp": dt_util.utc_from_timestamp(timestamp).isoformat()
+            }
+            for name in FIELDS[1:]:
+                value = self._columns[name][slot]
+                fix[name] = None if math.isnan(value) else value
+            fixes.append(fix)
+        return fixes
@@ -1,57 +1,114 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.components.lock import LockEntity
+from homeassistant.components.lock import LockEntity, LockEntityDescription
+from homeassistant.exceptions import ServiceValidationError
 
 from . import const as C
+from .model import VehicleData, path_getter
 from .vehicle_entity import VehicleEntity
 from .coordinator import MyDataCoordinator
 
 
-class HoodStatusEntity(VehicleEntity, LockEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Hood"
+@dataclass(frozen=True, kw_only=True)
+class FordLockEntityDescription(LockEntityDescription):
+    # Key paths the functions below read; see VehicleEntity._data_paths.
+    data_paths: tuple[str, ...]
+    is_locked_fn: Callable[[VehicleData], bool | None] | None = None
+    is_open_fn: Callable[[VehicleData], bool | None] | None = None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        status = self.coordinator.data["hood_status"]
-        self._attr_is_open = status != "CLOSED"
-        self.async_write_ha_state()
 
+def _not(path: str) -> Callable[[VehicleData], bool | None]:
+    get = path_getter(path)
 
-class AllDoorsEntity(VehicleEntity, LockEntity):
-    _attr_has_entity_name = True
-    _attr_name = "All Doors"
+    def is_not(data: VehicleData) -> bool | None:
+        value = get(data)
+        return None if value is None else not value
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        status = self.coordinator.data["doors"]["all_doors_locked"]
-        self._attr_is_locked = status
-        self.async_write_ha_state()
+    return is_not
+
+
+def _hood_open(data: VehicleData) -> bool | None:
+    status = data["hood_status"]
+    return status != "CLOSED" if status is not None else None
 
 
-class DoorEntity(VehicleEntity, LockEntity):
+_all_doors_locked = path_getter("doors.all_doors_locked")
+
+
+def _door(door: str, name: str) -> FordLockEntityDescription:
+    return FordLockEntityDescription(
+        key=f"doors.{door}",
+        name=f"Door: {name}",
+        data_paths=("doors.all_doors_locked", f"doors.{door}.closed"),
+        is_locked_fn=_all_doors_locked,
+        is_open_fn=_not(f"doors.{door}.closed"),
+    )
+
+
+LOCKS: tuple[FordLockEntityDescription, ...] = (
+    FordLockEntityDescription(
+        key="hood_status",
+        name="Hood",
+        data_paths=("hood_status",),
+        is_open_fn=_hood_open,
+    ),
+    FordLockEntityDescription(
+        key="doors.all_doors_locked",
+        name="All Doors",
+        data_paths=("doors.all_doors_locked",),
+        is_locked_fn=_all_doors_locked,
+    ),
+    _door("front_left", "Front Left"),
+    _door("front_right", "Front Right"),
+    _door("rear_left", "Rear Left"),
+    _door("rear_right", "Rear Right"),
+)
+
+
+class FordLockEntity(VehicleEntity, LockEntity):
     _attr_has_entity_name = True
+    entity_description: FordLockEntityDescription
 
     def __init__(
         self,
         coordinator: MyDataCoordinator,
         entry: ConfigEntry,
-        door: str,
-        friendly_name: str,
+        description: FordLockEntityDescription,
     ) -> None:
+        self.entity_description = description
+        self._data_paths = description.data_paths
         super().__init__(coordinator, entry)
-        self._door = door
-        self._attr_name = friendly_name
+        self._attr_name = description.name
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        all_locked = self.coordinator.data["doors"]["all_doors_locked"]
-        door = self.coordinator.data["doors"][self._door]
-        self._attr_is_locked = all_locked
-        self._attr_is_open = door["closed"] is False
+        description = self.entity_description
+        data = self.coordinator.data
+        if description.is_locked_fn is not None:
+            self._attr_is_locked = description.is_locked_fn(data)
+        if description.is_open_fn is not None:
+            self._attr_is_open = description.is_open_fn(data)
         self.async_write_ha_state()
 
+    async def async_lock(self, **kwargs: Any) -> None:
+        self._raise_read_only()
+
+    async def async_unlock(self, **kwargs: Any) -> None:
+        self._raise_read_only()
+
+    def _raise_read_only(self) -> None:
+        # Ford Connect Query only reports vehicle state; it has no command
+        # endpoint to lock or unlock with.
+        raise ServiceValidationError(
+            translation_domain=C.DOMAIN,
+            translation_key="commands_not_supported",
+            translation_placeholders={"entity_id": self.entity_id},
+        )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -61,13 +118,6 @@ async def async_setup_entry(
     data = hass.data[C.DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
     async_add_entities(
-        [
-            HoodStatusEntity(coordinator, entry),
-            AllDoorsEntity(coordinator, entry),
-            DoorEntity(coordinator, entry, "front_left", "Door: Front Left"),
-            DoorEntity(coordinator, entry, "front_right", "Door: Front Right"),
-            DoorEntity(coordinator, entry, "rear_left", "Door: Rear Left"),
-            DoorEntity(coordinator, entry, "rear_right", "Door: Rear Right"),
-        ],
+        [FordLockEntity(coordinator, entry, description) for description in LOCKS],
         update_before_add=False,
     )
@@ -0,0 +1,82 @@
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+DEFAULT_WINDOW = 128
+
+
+class RollingHistogram:
+    """Summary of the most recent ``window`` samples of a measurement.
+
+    Memory is bounded by the window; ``count`` and ``total`` keep counting
+    over the whole lifetime.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the samples in the window, oldest first."""
+        return iter(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        return self._samples[-1] if self._samples else None
+
+    @property
+    def max(self) -> float | None:
+        return max(self._samples, default=None)
+
+    def percentile(self, q: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "last": self.last,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": self.max,
+            "count": self.count,
+            "total": self.total,
+        }
+
+
+@dataclass
+class PollMetrics:
+    """Per-entry performance counters; durations are in seconds."""
+
+    token_refresh_time: RollingHistogram
+    poll_time: RollingHistogram = field(default_factory=RollingHistogram)
+    response_size: RollingHistogram = field(default_factory=RollingHistogram)
+    parse_time: RollingHistogram = field(default_factory=RollingHistogram)
+    fan_out_time: RollingHistogram = field(default_factory=RollingHistogram)
+    rate_limited: int = 0
+    failed_polls: int = 0
+    # Refresh requests served by another refresh's poll.
+    merged_requests: int = 0
+    last_success: datetime | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "token_refresh_time": self.token_refresh_time.as_dict(),
+            "poll_time": self.poll_time.as_dict(),
+            "response_size": self.response_size.as_dict(),
+            "parse_time": self.parse_time.as_dict(),
+            "fan_out_time": self.fan_out_time.as_dict(),
+            "rate_limited": self.rate_limited,
+            "failed_polls": self.failed_polls,
+            "merged_requests": self.merged_requests,
+            "last_success": self.last_success,
+        }
@@ -1,13 +1,72 @@
-from typing import Any, TypedDict
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Self
 
 
-class DoorStatus(TypedDict):
-    closed: bool
+class _Record(Mapping[str, Any]):
+    """Base of the slotted telemetry records.
 
+    A snapshot is parsed into one VehicleData and the records nested in it.
+    They keep their values in slots instead of a dict per object, which
+    roughly halves what each retained snapshot costs, and are never changed
+    once parsed. They still read like the dicts they replaced, so key paths
+    such as ``data["tires"]["front_left"]`` keep working.
+    """
 
-class Doors(TypedDict):
-    all_doors_locked: bool
-    driver_front_locked: bool
+    __slots__ = ()
+    __dataclass_fields__: dict[str, Any]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as nested dicts, e.g. to store it as JSON."""
+        result: dict[str, Any] = {}
+        for name in self.__dataclass_fields__:
+            value = getattr(self, name)
+            result[name] = value.as_dict() if isinstance(value, _Record) else value
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Self:
+        """Rebuild a record from as_dict() output that went through JSON.
+
+        JSON turns tuples into lists; they are turned back, so that the
+        restored record compares equal to a freshly parsed one. Raises
+        KeyError or TypeError if a field is missing or not a mapping.
+        """
+        values = []
+        for field in cls.__dataclass_fields__.values():
+            value = data[field.name]
+            if isinstance(field.type, type) and issubclass(field.type, _Record):
+                value = field.type.from_dict(value)
+            elif isinstance(value, list):
+                value = tuple(value)
+            values.append(value)
+        return cls(*values)
+
+
+@dataclass(slots=True)
+class DoorStatus(_Record):
+    closed: bool | None
+
+
+@dataclass(slots=True)
+class Doors(_Record):
+    all_doors_locked: bool | None
+    driver_front_locked: bool | None
     front_left: DoorStatus
     front_right: DoorStatus
     rear_left: DoorStatus
@@ -15,234 +74,431 @@ class Doors(TypedDict):
     tailgate: DoorStatus
 
 
-class TireStatus(TypedDict):
+@dataclass(slots=True)
+class TireStatus(_Record):
     status: str
     pressure: float
     placard_pressure: float
 
 
-class Tires(TypedDict):
+@dataclass(slots=True)
+class Tires(_Record):
     front_left: TireStatus
     front_right: TireStatus
     rear_left: TireStatus
     rear_right: TireStatus
 
 
-class WindowStatus(TypedDict):
+@dataclass(slots=True)
+class WindowStatus(_Record):
     lower: float
     upper: float
 
 
-class Windows(TypedDict):
+@dataclass(slots=True)
+class Windows(_Record):
     front_left: WindowStatus
     front_right: WindowStatus
     rear_left: WindowStatus
     rear_right: WindowStatus
 
 
-class VehicleData(TypedDict):
-    acceleration: tuple[float, float, float]
-    accelerator_pedal_position: float
-    ambient_temp: float
-    battery_charge_level: float
-    battery_voltage: float
-    brake_pedal_status: str
-    brake_torque: float
-    compass_direction: str
+@dataclass(slots=True)
+class VehicleData(_Record):
+    acceleration: tuple[float, float, float] | None
+    accelerator_pedal_position: float | None
+    ambient_temp: float | None
+    battery_charge_level: float | None
+    battery_voltage: float | None
+    brake_pedal_status: str | None
+    brake_torque: float | None
+    compass_direction: str | None
     doors: Doors
-    engine_coolant_temp: float
-    engine_speed: float
-    fuel_level: float
-    fuel_range: float
-    gear_lever_position: str
-    heading: tuple[str, str, float, float]
-    hood_status: str
-    hybrid_vehicle_mode_status: str
-    ignition_status: str
-    outside_temperature: float
-    yaw_rate: float
+    engine_coolant_temp: float | None
+    engine_speed: float | None
+    fuel_level: float | None
+    fuel_range: float | None
+    gear_lever_position: str | None
+    heading: tuple[str, str, float, float] | None
+    hood_status: str | None
+    hybrid_vehicle_mode_status: str | None
+    ignition_status: str | None
+    outside_temperature: float | None
+    yaw_rate: float | None
     windows: Windows
-    wheel_torque_status: str
+    wheel_torque_status: str | None
     tires: Tires
-    position: tuple[str, float, float, float]
+    position: tuple[str, float, float, float] | None
+    position_uncertainty: float | None
     parking_brake_status: tuple[str, str] | None
-    oil_life_remaining: float
-    odometer: float
-    speed: float
-    vehicle_life_cycle_mode: str
-    battery_load_status: tuple[str, str]
-    torque_at_transmission: float
-    trip_fuel_economy: tuple[str, float]
-    trip_xev_battery_distance_accumulated: tuple[str, float]
+    oil_life_remaining: float | None
+    odometer: float | None
+    speed: float | None
+    vehicle_life_cycle_mode: str | None
+    battery_load_status: tuple[str, str] | None
+    torque_at_transmission: float | None
+    trip_fuel_economy: tuple[str, float] | None
+    trip_xev_battery_distance_accumulated: tuple[str, float] | None
 
 
-def parse_api_response(data: dict[str, Any]) -> VehicleData:
-    metrics = data["metrics"]
-    tire_pressure_status = {
-        i["vehicleWheel"]: i["value"] for i in metrics["tirePressureStatus"]
-    }
-    tire_pressure = {i["vehicleWheel"]: i for i in metrics["tirePressure"]}
-    windows = {
-        i["vehicleSide"] + "." + i["vehicleWindow"]: i["value"]
-        for i in metrics["windowStatus"]
-    }
-    door_lock = {
-        i.get("vehicleSide", "") + "." + i["vehicleDoor"]: i
-        for i in metrics["doorLockStatus"]
-    }
-    door_status = {
-        (
-            i.get("vehicleDoor", ""),
-            i.get("vehicleSide", ""),
-            i.get("vehicleOccupantRole", ""),
-        ): i
-        for i in metrics["doorStatus"]
+def path_getter(path: str) -> Callable[[VehicleData], Any]:
+    """Compile an ``a.b.c`` path into VehicleData into a getter.
+
+    Used for the paths of the entity description tables. The records are
+    read by attribute, so a None that is not at the end of the path raises.
+    """
+    return attrgetter(path)
+
+
+def fuel_reported(data: VehicleData) -> bool:
+    """Fuel figures read zero while the vehicle is off; keep the last ones."""
+    return (data["fuel_range"] or 0.0) > 0.0 or data["ignition_status"] == "ON"
+
+
+def changed_paths(
+    old: Mapping[str, Any] | None, new: Mapping[str, Any] | None, prefix: str = ""
+) -> set[str]:
+    """Return the ``a.b.c`` key paths that differ between two snapshots.
+
+    Nested mappings are compared in place, without flattening copies, and
+    anything else (including tuples) is a leaf. Every ancestor of a changed
+    leaf is included as well, so a dependency on ``doors.front_left``
+    matches a change of ``doors.front_left.closed``.
+    """
+    changed: set[str] = set()
+    if isinstance(old, _Record) and old.__class__ is new.__class__:
+        _record_changes(old, new, prefix, changed)
+        return changed
+    old = old or {}
+    new = new or {}
+    for key in old.keys() | new.keys():
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value is new_value:
+            continue
+        path = prefix + key
+        old_nested = isinstance(old_value, Mapping)
+        new_nested = isinstance(new_value, Mapping)
+        if old_nested and new_nested:
+            nested = changed_paths(old_value, new_value, path + ".")
+            if nested:
+                changed.add(path)
+                changed |= nested
+        elif old_nested or new_nested:
+            # A whole subtree appeared or went away.
+            changed.add(path)
+            changed |= changed_paths(
+                old_value if old_nested else None,
+                new_value if new_nested else None,
+                path + ".",
+            )
+        elif key not in old or key not in new or old_value != new_value:
+            changed.add(path)
+    return changed
+
+
+def _record_changes(
+    old: _Record, new: _Record, prefix: str, changed: set[str]
+) -> None:
+    """changed_paths for two records of the same type, by attribute."""
+    for key in old.__dataclass_fields__:
+        old_value = getattr(old, key)
+        new_value = getattr(new, key)
+        if old_value is new_value or old_value == new_value:
+            continue
+        path = prefix + key
+        changed.add(path)
+        if (
+            isinstance(old_value, _Record)
+            and old_value.__class__ is new_value.__class__
+        ):
+            _record_changes(old_value, new_value, path + ".", changed)
+
+
+# List-valued metrics are indexed by the fields that tell their entries apart.
+_LIST_KEYS: dict[str, tuple[str, ...]] = {
+    "doorLockStatus": ("vehicleSide", "vehicleDoor"),
+    "doorStatus": ("vehicleDoor", "vehicleSide", "vehicleOccupantRole"),
+    "tirePressure": ("vehicleWheel",),
+    "tirePressureStatus": ("vehicleWheel",),
+    "windowStatus": ("vehicleSide", "vehicleWindow"),
+}
+
+
+class _Field:
+    """A single VehicleData leaf and where to find it in the metrics."""
+
+    __slots__ = (
+        "metric",
+        "key",
+        "paths",
+        "equals",
+        "default",
+        "optional",
+        "path",
+    )
+
+    def __init__(
+        self,
+        metric: str,
+        key: tuple[str, ...],
+        paths: tuple[tuple[str, ...], ...],
+        equals: str | None,
+        default: Any,
+        optional: bool,
+    ) -> None:
+        self.metric = metric
+        # Tells the entry apart within a list-valued metric; see _LIST_KEYS.
+        self.key = key
+        self.paths = paths
+        # When given, the field is whether the value equals it.
+        self.equals = equals
+        self.default = default
+        self.optional = optional
+        # Where the field sits in VehicleData, e.g. "doors.tailgate.closed";
+        # reported in the errors when the field cannot be read.
+        self.path = ""
+
+
+# What most fields read: the "value" member of their metric.
+_VALUE = (("value",),)
+
+
+def _value(
+    metric: str,
+    *paths: tuple[str, ...],
+    key: tuple[str, ...] = (),
+    equals: str | None = None,
+    default: Any = None,
+    optional: bool = False,
+) -> _Field:
+    return _Field(metric, key, paths or _VALUE, equals, default, optional)
+
+
+def _door(door: str, side: str, role: str) -> dict[str, Any]:
+    return {
+        "closed": _value(
+            "doorStatus", key=(door, side, role), equals="CLOSED"
+        )
     }
 
-    parking_brake_status = None
-    if "parkingBrakeStatus" in metrics:
-        parking_brake_status = (
-            metrics["parkingBrakeStatus"]["parkingBrakeType"],
-            metrics["parkingBrakeStatus"]["value"],
+
+def _window(side: str, window: str) -> dict[str, Any]:
+    return {
+        part: _value(
+            "windowStatus",
+            ("value", part),
+            key=(side, window),
+            default=0.0,
+            optional=True,
         )
+        for part in ("lower", "upper")
+    }
+
 
+def _tire(wheel: str, placard: str) -> dict[str, Any]:
     return {
-        "acceleration": (
-            metrics["acceleration"]["value"]["x"],
-            metrics["acceleration"]["value"]["y"],
-            metrics["acceleration"]["value"]["z"],
-        ),
-        "accelerator_pedal_position": metrics["acceleratorPedalPosition"]["value"],
-        "ambient_temp": metrics["ambientTemp"]["value"],
-        "battery_charge_level": metrics["batteryStateOfCharge"]["value"],
-        "battery_voltage": metrics["batteryVoltage"]["value"],
-        "brake_pedal_status": metrics["brakePedalStatus"]["value"],
-        "brake_torque": metrics["brakeTorque"]["value"],
-        "compass_direction": metrics["compassDirection"]["value"],
-        "doors": {
-            "all_doors_locked": door_lock[".ALL_DOORS"]["value"] == "LOCKED",
-            "driver_front_locked": door_lock["DRIVER.UNSPECIFIED_FRONT"]["value"]
-            == "LOCKED",
-            "front_left": {
-                "closed": door_status[("UNSPECIFIED_FRONT", "DRIVER", "DRIVER")][
-                    "value"
-                ]
-                == "CLOSED",
-            },
-            "front_right": {
-                "closed": door_status[("UNSPECIFIED_FRONT", "PASSENGER", "PASSENGER")][
-                    "value"
-                ]
-                == "CLOSED",
-            },
-            "rear_left": {
-                "closed": door_status[("REAR_LEFT", "UNKNOWN", "PASSENGER")]["value"]
-                == "CLOSED",
-            },
-            "rear_right": {
-                "closed": door_status[("REAR_RIGHT", "UNKNOWN", "PASSENGER")]["value"]
-                == "CLOSED",
-            },
-            "tailgate": {
-                "closed": door_status[("TAILGATE", "", "PASSENGER")]["value"]
-                == "CLOSED",
-            },
-        },
-        "engine_coolant_temp": metrics["engineCoolantTemp"]["value"],
-        "engine_speed": metrics["engineSpeed"]["value"],
-        "fuel_level": metrics["fuelLevel"]["value"],
-        "fuel_range": metrics["fuelRange"]["value"],
-        "gear_lever_position": metrics["gearLeverPosition"]["value"],
-        "heading": (
-            metrics["heading"]["gpsModuleTimestamp"],
-            metrics["heading"]["value"]["detectionType"],
-            metrics["heading"]["value"]["heading"],
-            metrics["heading"]["value"]["uncertainty"],
-        ),
-        "hood_status": metrics["hoodStatus"]["value"],
-        "hybrid_vehicle_mode_status": metrics["hybridVehicleModeStatus"]["value"],
-        "ignition_status": metrics["ignitionStatus"]["value"],
-        "outside_temperature": metrics["outsideTemperature"]["value"],
-        "yaw_rate": metrics["yawRate"]["value"],
-        "windows": {
-            "front_left": {
-                "lower": windows.get("DRIVER.UNSPECIFIED_FRONT", {}).get("lower", 0.0),
-                "upper": windows.get("DRIVER.UNSPECIFIED_FRONT", {}).get("upper", 0.0),
-            },
-            "front_right": {
-                "lower": windows.get("PASSENGER.UNSPECIFIED_FRONT", {}).get(
-                    "lower", 0.0
-                ),
-                "upper": windows.get("PASSENGER.UNSPECIFIED_FRONT", {}).get(
-                    "upper", 0.0
-                ),
-            },
-            "rear_left": {
-                "lower": windows.get("DRIVER.UNSPECIFIED_REAR", {}).get("lower", 0.0),
-                "upper": windows.get("DRIVER.UNSPECIFIED_REAR", {}).get("upper", 0.0),
-            },
-            "rear_right": {
-                "lower": windows.get("PASSENGER.UNSPECIFIED_REAR", {}).get(
-                    "lower", 0.0
-                ),
-                "upper": windows.get("PASSENGER.UNSPECIFIED_REAR", {}).get(
-                    "upper", 0.0
-                ),
-            },
-        },
-        "wheel_torque_status": metrics["wheelTorqueStatus"]["value"],
-        "tires": {
-            "front_left": {
-                "status": tire_pressure_status.get("FRONT_LEFT", ""),
-                "pressure": tire_pressure.get("FRONT_LEFT", {}).get("value", 0.0),
-                "placard_pressure": tire_pressure.get("FRONT_LEFT", {}).get(
-                    "wheelPlacardFront", 0.0
-                ),
-            },
-            "front_right": {
-                "status": tire_pressure_status.get("FRONT_RIGHT", ""),
-                "pressure": tire_pressure.get("FRONT_RIGHT", {}).get("value", 0.0),
-                "placard_pressure": tire_pressure.get("FRONT_RIGHT", {}).get(
-                    "wheelPlacardFront", 0.0
-                ),
-            },
-            "rear_left": {
-                "status": tire_pressure_status.get("REAR_LEFT", ""),
-                "pressure": tire_pressure.get("REAR_LEFT", {}).get("value", 0.0),
-                "placard_pressure": tire_pressure.get("REAR_LEFT", {}).get(
-                    "wheelPlacardRear", 0.0
-                ),
-            },
-            "rear_right": {
-                "status": tire_pressure_status.get("REAR_RIGHT", ""),
-                "pressure": tire_pressure.get("REAR_RIGHT", {}).get("value", 0.0),
-                "placard_pressure": tire_pressure.get("REAR_RIGHT", {}).get(
-                    "wheelPlacardRear", 0.0
-                ),
-            },
-        },
-        "position": (
-            metrics["position"]["gpsModuleTimestamp"],
-            metrics["position"]["value"]["location"]["lat"],
-            metrics["position"]["value"]["location"]["lon"],
-            metrics["position"]["value"]["location"]["alt"],
+        "status": _value(
+            "tirePressureStatus", key=(wheel,), default="", optional=True
         ),
-        "parking_brake_status": parking_brake_status,
-        "oil_life_remaining": metrics["oilLifeRemaining"]["value"],
-        "odometer": metrics["odometer"]["value"],
-        "speed": metrics["speed"]["value"],
-        "vehicle_life_cycle_mode": metrics["vehicleLifeCycleMode"]["value"],
-        "battery_load_status": (
-            metrics["batteryLoadStatus"]["vehicleBattery"],
-            metrics["batteryLoadStatus"]["value"],
+        "pressure": _value("tirePressure", key=(wheel,), default=0.0, optional=True),
+        "placard_pressure": _value(
+            "tirePressure", (placard,), key=(wheel,), default=0.0, optional=True
         ),
-        "torque_at_transmission": metrics["torqueAtTransmission"]["value"],
-        "trip_fuel_economy": (
-            metrics["tripFuelEconomy"]["tripProgress"],
-            metrics["tripFuelEconomy"]["value"],
+    }
+
+
+_FIELDS: dict[str, Any] = {
+    "acceleration": _value(
+        "acceleration", ("value", "x"), ("value", "y"), ("value", "z")
+    ),
+    "accelerator_pedal_position": _value("acceleratorPedalPosition"),
+    "ambient_temp": _value("ambientTemp"),
+    "battery_charge_level": _value("batteryStateOfCharge"),
+    "battery_voltage": _value("batteryVoltage"),
+    "brake_pedal_status": _value("brakePedalStatus"),
+    "brake_torque": _value("brakeTorque"),
+    "compass_direction": _value("compassDirection"),
+    "doors": {
+        "all_doors_locked": _value(
+            "doorLockStatus", key=("", "ALL_DOORS"), equals="LOCKED"
         ),
-        "trip_xev_battery_distance_accumulated": (
-            metrics["tripXevBatteryDistanceAccumulated"]["tripProgress"],
-            metrics["tripXevBatteryDistanceAccumulated"]["value"],
+        "driver_front_locked": _value(
+            "doorLockStatus",
+            key=("DRIVER", "UNSPECIFIED_FRONT"),
+            equals="LOCKED",
         ),
-    }
+        "front_left": _door("UNSPECIFIED_FRONT", "DRIVER", "DRIVER"),
+        "front_right": _door("UNSPECIFIED_FRONT", "PASSENGER", "PASSENGER"),
+        "rear_left": _door("REAR_LEFT", "UNKNOWN", "PASSENGER"),
+        "rear_right": _door("REAR_RIGHT", "UNKNOWN", "PASSENGER"),
+        "tailgate": _door("TAILGATE", "", "PASSENGER"),
+    },
+    "engine_coolant_temp": _value("engineCoolantTemp"),
+    "engine_speed": _value("engineSpeed"),
+    "fuel_level": _value("fuelLevel"),
+    "fuel_range": _value("fuelRange"),
+    "gear_lever_position": _value("gearLeverPosition"),
+    "heading": _value(
+        "heading",
+        ("gpsModuleTimestamp",),
+        ("value", "detectionType"),
+        ("value", "heading"),
+        ("value", "uncertainty"),
+    ),
+    "hood_status": _value("hoodStatus"),
+    "hybrid_vehicle_mode_status": _value("hybridVehicleModeStatus"),
+    "ignition_status": _value("ignitionStatus"),
+    "outside_temperature": _value("outsideTemperature"),
+    "yaw_rate": _value("yawRate"),
+    "windows": {
+        "front_left": _window("DRIVER", "UNSPECIFIED_FRONT"),
+        "front_right": _window("PASSENGER", "UNSPECIFIED_FRONT"),
+        "rear_left": _window("DRIVER", "UNSPECIFIED_REAR"),
+        "rear_right": _window("PASSENGER", "UNSPECIFIED_REAR"),
+    },
+    "wheel_torque_status": _value("wheelTorqueStatus"),
+    "tires": {
+        "front_left": _tire("FRONT_LEFT", "wheelPlacardFront"),
+        "front_right": _tire("FRONT_RIGHT", "wheelPlacardFront"),
+        "rear_left": _tire("REAR_LEFT", "wheelPlacardRear"),
+        "rear_right": _tire("REAR_RIGHT", "wheelPlacardRear"),
+    },
+    "position": _value(
+        "position",
+        ("gpsModuleTimestamp",),
+        ("value", "location", "lat"),
+        ("value", "location", "lon"),
+        ("value", "location", "alt"),
+    ),
+    # Horizontal accuracy of the fix in metres; not every vehicle reports it.
+    "position_uncertainty": _value(
+        "position", ("value", "uncertainty"), optional=True
+    ),
+    "parking_brake_status": _value(
+        "parkingBrakeStatus", ("parkingBrakeType",), ("value",), optional=True
+    ),
+    "oil_life_remaining": _value("oilLifeRemaining"),
+    "odometer": _value("odometer"),
+    "speed": _value("speed"),
+    "vehicle_life_cycle_mode": _value("vehicleLifeCycleMode"),
+    "battery_load_status": _value(
+        "batteryLoadStatus", ("vehicleBattery",), ("value",)
+    ),
+    "torque_at_transmission": _value("torqueAtTransmission"),
+    "trip_fuel_economy": _value("tripFuelEconomy", ("tripProgress",), ("value",)),
+    "trip_xev_battery_distance_accumulated": _value(
+        "tripXevBatteryDistanceAccumulated", ("tripProgress",), ("value",)
+    ),
+}
+
+
+def _metric_names(fields: dict[str, Any]) -> set[str]:
+    names: set[str] = set()
+    for field in fields.values():
+        if isinstance(field, _Field):
+            names.add(field.metric)
+        else:
+            names |= _metric_names(field)
+    return names
+
+
+# The API metrics parse_api_response reads; everything else is ignored.
+USED_METRICS = frozenset(_metric_names(_FIELDS))
+
+# What a missing or malformed metric raises while its field is read.
+_READ_ERRORS = (KeyError, IndexError, TypeError, ValueError, AttributeError)
+
+
+class _Table:
+    """A record type and how to read each of its fields, in field order."""
+
+    __slots__ = ("record", "fields")
+
+    def __init__(
+        self, fields: dict[str, Any], record: type[_Record], prefix: str = ""
+    ) -> None:
+        if list(fields) != list(record.__dataclass_fields__):
+            raise ValueError(f"The field table does not match {record.__name__}")
+        self.record = record
+        self.fields: list[_Field | _Table] = []
+        for name, field in fields.items():
+            if isinstance(field, _Field):
+                if field.key and field.metric not in _LIST_KEYS:
+                    raise ValueError(f"{field.metric} is not a list-valued metric")
+                field.path = prefix + name
+                self.fields.append(field)
+            else:
+                nested = record.__dataclass_fields__[name].type
+                self.fields.append(_Table(field, nested, f"{prefix}{name}."))
+
+
+_TABLE = _Table(_FIELDS, VehicleData)
+
+
+def _index_lists(metrics: dict[str, Any]) -> dict[str, dict[tuple[str, ...], Any]]:
+    """Index the entries of each list-valued metric by their _LIST_KEYS."""
+    lists: dict[str, dict[tuple[str, ...], Any]] = {}
+    for metric, keys in _LIST_KEYS.items():
+        try:
+            lists[metric] = {
+                tuple([item.get(key, "") for key in keys]): item
+                for item in metrics[metric]
+            }
+        except _READ_ERRORS:
+            lists[metric] = {}
+    return lists
+
+
+def parse_api_response(
+    data: dict[str, Any], errors: list[str] | None = None
+) -> VehicleData:
+    """Parse a telemetry response into VehicleData.
+
+    Fields are read in one pass over the field table. A missing or
+    malformed metric only sets its own field to the field's default (usually
+    None); the path of each such required field is appended to ``errors``
+    when given.
+    """
+    metrics = data["metrics"]
+    return _parse(_TABLE, metrics, _index_lists(metrics), errors)
+
+
+def _parse(
+    table: _Table,
+    metrics: dict[str, Any],
+    lists: dict[str, dict[tuple[str, ...], Any]],
+    errors: list[str] | None,
+) -> Any:
+    values: list[Any] = []
+    for field in table.fields:
+        if field.__class__ is _Table:
+            values.append(_parse(field, metrics, lists, errors))
+            continue
+        try:
+            if field.key:
+                entry = lists[field.metric][field.key]
+            else:
+                entry = metrics[field.metric]
+            paths = field.paths
+            if paths is _VALUE:
+                value = entry["value"]
+            elif len(paths) == 1:
+                value = _read(entry, paths[0])
+            else:
+                # Fields made of several members read a tuple of them.
+                value = tuple([_read(entry, path) for path in paths])
+            if field.equals is not None:
+                value = value == field.equals
+        except _READ_ERRORS:
+            value = field.default
+            if errors is not None and not field.optional:
+                errors.append(field.path)
+        values.append(value)
+    return table.record(*values)
+
+
+def _read(entry: Any, path: tuple[str, ...]) -> Any:
+    for part in path:
+        entry = entry[part]
+    return entry
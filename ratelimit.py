@@ -0,0 +1,123 @@
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+import random
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+DEFAULT_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Read a Retry-After header given either in seconds or as an HTTP date."""
+    if not headers or (value := headers.get("Retry-After")) is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - dt_util.utcnow()).total_seconds())
+
+
+class AccountLimiter:
+    """Rate limiter and circuit breaker shared by all entries of one account.
+
+    Requests draw from a token bucket of ``burst`` tokens refilled at
+    ``rate`` tokens per second. A 429 pauses every caller for the server's
+    Retry-After. After ``failure_threshold`` consecutive server errors or
+    timeouts the circuit opens and requests are held back for an
+    exponentially growing, jittered backoff; the first request after that
+    is a probe whose outcome closes or reopens the circuit.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.2,
+        burst: int = 10,
+        failure_threshold: int = 3,
+        base_backoff: float = 30.0,
+        max_backoff: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._failure_threshold = failure_threshold
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._jitter = jitter
+
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._blocked_until = 0.0
+        self._failures = 0
+        self.rate_limited_count = 0
+        self.failure_count = 0
+
+    @property
+    def circuit_open(self) -> bool:
+        return self._failures >= self._failure_threshold
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._refilled_at = now
+
+    def blocked_for(self) -> float:
+        """Return how many seconds a 429 or the open circuit holds callers back."""
+        return max(0.0, self._blocked_until - self._clock())
+
+    def throttled_for(self) -> float:
+        """Return how many seconds until the token bucket allows a request."""
+        self._refill(self._clock())
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self._rate
+
+    def take(self) -> None:
+        self._refill(self._clock())
+        self._tokens -= 1.0
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_rate_limited(self, retry_after: float | None) -> float:
+        """Pause all callers for the server's Retry-After; return the pause."""
+        self.rate_limited_count += 1
+        if retry_after is None:
+            retry_after = DEFAULT_RETRY_AFTER
+        self._block(retry_after)
+        return retry_after
+
+    def record_failure(self) -> float:
+        """Count a server error or timeout; return the backoff to apply."""
+        self.failure_count += 1
+        self._failures += 1
+        if not self.circuit_open:
+            return 0.0
+        exponent = self._failures - self._failure_threshold
+        backoff = min(self._max_backoff, self._base_backoff * 2**exponent)
+        backoff *= 0.5 + self._jitter() / 2
+        self._block(backoff)
+        return backoff
+
+    def _block(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        throttled_for = self.throttled_for()
+        return {
+            "tokens": round(self._tokens, 2),
+            "blocked_for": round(self.blocked_for(), 1),
+            "throttled_for": round(throttled_for, 1),
+            "circuit_open": self.circuit_open,
+            "consecutive_failures": self._failures,
+            "failure_count": self.failure_count,
+            "rate_limited_count": self.rate_limited_count,
+        }
@@ -0,0 +1,180 @@
+"""Record live telemetry responses and replay them through the coordinator.
+
+A trace is a JSON Lines file. Each line holds one raw telemetry body and the
+time it was received::
+
+    {"t":1760781600.123,"body":{...}}
+
+The body is written verbatim, so replaying it exercises the same decoding,
+parsing and entity fan-out as a live poll.
+"""
+
+from bisect import bisect_right
+from datetime import timedelta
+import logging
+import mmap
+from pathlib import Path
+import threading
+import time
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .api import FordAPI
+from .coordinator import MyDataCoordinator
+from .model import VehicleData
+from .ratelimit import AccountLimiter
+from .token_manager import TokenManager
+
+LOGGER = logging.getLogger(__name__)
+
+_PREFIX = b'{"t":'
+_BODY = b',"body":'
+
+# Interval between records when replaying as fast as possible, and once the
+# end of the trace has been reached.
+FAST_INTERVAL = timedelta(seconds=0.1)
+IDLE_INTERVAL = timedelta(hours=1)
+
+
+class TraceRecorder:
+    """Append raw telemetry bodies to a trace file from the executor."""
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        self._hass = hass
+        self._path = path
+        self._lock = threading.Lock()
+
+    @callback
+    def record(self, body: bytes) -> None:
+        # Newlines can only be insignificant whitespace in a JSON body.
+        line = b"%s%r%s%s}\n" % (
+            _PREFIX,
+            time.time(),
+            _BODY,
+            body.strip().replace(b"\n", b" "),
+        )
+        self._hass.async_add_executor_job(self._append, line)
+
+    def _append(self, line: bytes) -> None:
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("ab") as f:
+                f.write(line)
+
+
+class Trace:
+    """Memory-mapped trace indexed by timestamp.
+
+    Loading only scans for line boundaries and timestamps; bodies are sliced
+    out of the mapping when they are replayed. Both are blocking and belong
+    in the executor.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        records: list[tuple[float, int, int]] = []
+        pos = 0
+        size = len(self._map)
+        while pos < size:
+            end = self._map.find(b"\n", pos)
+            if end == -1:
+                end = size
+            body_at = self._map.find(_BODY, pos, end)
+            if self._map[pos : pos + len(_PREFIX)] == _PREFIX and body_at != -1:
+                stamp = float(self._map[pos + len(_PREFIX) : body_at])
+                records.append((stamp, body_at + len(_BODY), end))
+            pos = end + 1
+
+        if not records:
+            self._map.close()
+            raise ValueError(f"Trace {path} contains no records")
+
+        records.sort()
+        self.times = [record[0] for record in records]
+        self._spans = [record[1:] for record in records]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def index_at(self, stamp: float) -> int:
+        """Return the last record received at or before ``stamp``."""
+        return max(0, bisect_right(self.times, stamp) - 1)
+
+    def body(self, index: int) -> bytes:
+        start, end = self._spans[index]
+        return self._map[start:end].rstrip().removesuffix(b"}")
+
+    def close(self) -> None:
+        self._map.close()
+
+
+class ReplayCoordinator(MyDataCoordinator):
+    """Coordinator that plays a recorded trace instead of polling the API.
+
+    ``speed`` scales trace time to wall-clock time: 1.0 is real time, 10.0
+    is ten times faster and 0 steps through the records as fast as possible.
+    """
+
+    # Every refresh moves to the next record; none may reuse the last one.
+    coalesce_window = 0
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        tokens: TokenManager,
+        api: FordAPI,
+        limiter: AccountLimiter,
+        entry: ConfigEntry,
+        trace_path: Path,
+        speed: float,
+    ) -> None:
+        super().__init__(hass, tokens, api, limiter, entry)
+        self._trace_path = trace_path
+        self._speed = speed
+        self._trace: Trace | None = None
+        self._position = -1
+        self._started_at = 0.0
+
+    def _trace_time(self, trace: Trace) -> float:
+        elapsed = time.monotonic() - self._started_at
+        return trace.times[0] + elapsed * self._speed
+
+    async def _async_fetch(self, errors: list[str]) -> VehicleData | None:
+        if self._trace is None:
+            self._trace = await self.hass.async_add_executor_job(
+                Trace, self._trace_path
+            )
+            self._started_at = time.monotonic()
+            LOGGER.info(
+                "Replaying %d records from %s", len(self._trace), self._trace_path
+            )
+        trace = self._trace
+
+        if self._speed > 0:
+            position = trace.index_at(self._trace_time(trace))
+        else:
+            position = min(self._position + 1, len(trace) - 1)
+        if position == self._position:
+            return None
+
+        self._position = position
+        body = await self.hass.async_add_executor_job(trace.body, position)
+        return self._api.decode_telemetry(body, errors)
+
+    def _next_update_interval(self, data: VehicleData | None) -> timedelta:
+        trace = self._trace
+        if trace is None or self._position + 1 >= len(trace):
+            return IDLE_INTERVAL
+        if self._speed <= 0:
+            return FAST_INTERVAL
+        wait = trace.times[self._position + 1] - self._trace_time(trace)
+        return max(FAST_INTERVAL, timedelta(seconds=wait / self._speed))
+
+    async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
@@ -0,0 +1,113 @@
+from collections.abc import Callable
+from datetime import timedelta
+import hashlib
+import random
+import time
+
+from .model import VehicleData
+
+PARKED_GEARS = ("PARK", None)
+
+# Every poll is moved by up to this fraction of its interval, at most
+# MAX_JITTER seconds, so that entries sharing a phase still drift apart.
+JITTER_FRACTION = 0.1
+MAX_JITTER = 10.0
+
+
+def phase_offset(key: str) -> float:
+    """Map a key such as the VIN to a stable fraction in [0, 1)."""
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+def is_vehicle_active(data: VehicleData) -> bool:
+    """Return True while the vehicle is running or moving."""
+    return (
+        data["ignition_status"] == "ON"
+        or (data["speed"] or 0.0) > 0.0
+        or data["gear_lever_position"] not in PARKED_GEARS
+    )
+
+
+class AdaptivePollScheduler:
+    """Pick the next poll interval from the last telemetry snapshot.
+
+    While the vehicle is active the interval drops straight to
+    ``min_interval`` so the start of a trip is tracked closely. Once it stops,
+    the interval ramps linearly with idle time over ``ramp`` towards
+    ``max_interval``. A parked but unlocked vehicle only ramps half way, as it
+    is likely to be driven again soon.
+
+    Polls are placed on a grid of the chosen interval, shifted by ``phase``
+    (a fraction of the interval) and jittered, so that entries created or
+    reloaded together spread their requests over the interval instead of
+    polling in lockstep.
+    """
+
+    def __init__(
+        self,
+        min_interval: timedelta,
+        max_interval: timedelta,
+        ramp: timedelta = timedelta(minutes=15),
+        clock: Callable[[], float] = time.monotonic,
+        phase: float = 0.0,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self._clock = clock
+        self._phase = phase
+        self._jitter = jitter
+        self._ramp = ramp.total_seconds()
+        self._last_active = clock()
+        self.set_limits(min_interval, max_interval)
+        self._current = self.min_interval
+
+    def set_limits(self, min_interval: timedelta, max_interval: timedelta) -> None:
+        if min_interval > max_interval:
+            raise ValueError("min_interval must not exceed max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    @property
+    def current_interval(self) -> timedelta:
+        return self._current
+
+    @property
+    def first_delay(self) -> timedelta:
+        """Delay before the first poll, spreading entries set up together."""
+        return self.min_interval * self._phase
+
+    def next_interval(self, data: VehicleData | None) -> timedelta:
+        return self._spread(self._pick_interval(data))
+
+    def _spread(self, interval: timedelta) -> timedelta:
+        """Return the delay until this entry's next slot for ``interval``."""
+        seconds = interval.total_seconds()
+        if seconds <= 0:
+            return interval
+        # At least half an interval away, so on average polls come exactly
+        # as often as the interval asks for.
+        delay = (self._phase * seconds - self._clock()) % seconds
+        if delay < seconds / 2:
+            delay += seconds
+        jitter = min(seconds * JITTER_FRACTION, MAX_JITTER)
+        delay += (2 * self._jitter() - 1) * jitter
+        return timedelta(seconds=max(0.0, delay))
+
+    def _pick_interval(self, data: VehicleData | None) -> timedelta:
+        if data is None:
+            return self._current
+
+        now = self._clock()
+        if is_vehicle_active(data):
+            self._last_active = now
+            self._current = self.min_interval
+            return self._current
+
+        ceiling = self.max_interval
+        if not data["doors"]["all_doors_locked"]:
+            ceiling = (self.min_interval + self.max_interval) / 2
+
+        idle = now - self._last_active
+        fraction = min(1.0, idle / self._ramp) if self._ramp > 0 else 1.0
+        self._current = self.min_interval + (ceiling - self.min_interval) * fraction
+        return self._current
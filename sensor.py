@@ -1,148 +1,311 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
 import logging
+from typing import Any
 from homeassistant.components.sensor.const import SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfInformation, UnitOfTime
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.typing import StateType
 from homeassistant.components.sensor import (
     RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
 )
 
 from . import const as C
+from .model import VehicleData, fuel_reported, path_getter
 from .vehicle_entity import VehicleEntity
 from .coordinator import MyDataCoordinator
+from .metrics import PollMetrics, RollingHistogram
 
 
 LOGGER = logging.getLogger(__name__)  # noqa: F821
 
 
-class AmbientTempEntity(VehicleEntity, SensorEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Ambient Temperature"
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = "°C"
-    _attr_suggested_display_precision = 1
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["ambient_temp"]
-        self.async_write_ha_state()
+@dataclass(frozen=True, kw_only=True)
+class FordSensorEntityDescription(SensorEntityDescription):
+    value_fn: Callable[[VehicleData], StateType]
+    # Key paths value_fn and update_fn read; see VehicleEntity._data_paths.
+    data_paths: tuple[str, ...]
+    # When given, the value is only updated while this returns True and the
+    # previous value is kept otherwise.
+    update_fn: Callable[[VehicleData], bool] | None = None
+    restore: bool = False
+    # Numeric changes smaller than this keep the previous value, so that
+    # jitter does not turn into state writes and recorder rows.
+    deadband: float | None = None
+
+
+def _metric(
+    path: str,
+    name: str,
+    transform: Callable[[Any], StateType] | None = None,
+    **kwargs: Any,
+) -> FordSensorEntityDescription:
+    """Describe a sensor reading a single VehicleData path."""
+    get = path_getter(path)
+    if transform is None:
+        value_fn = get
+    else:
+
+        def value_fn(data: VehicleData) -> StateType:
+            value = get(data)
+            return transform(value) if value is not None else None
+
+    return FordSensorEntityDescription(
+        key=path,
+        name=name,
+        value_fn=value_fn,
+        data_paths=(path, *kwargs.pop("data_paths", ())),
+        **kwargs,
+    )
 
 
-class BatteryChargeLevelEntity(VehicleEntity, SensorEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Battery Charge Level"
-    _attr_device_class = SensorDeviceClass.BATTERY
-    _attr_native_unit_of_measurement = "%"
-    _attr_suggested_display_precision = 1
+_CORNERS = {
+    "front_left": "Front Left",
+    "front_right": "Front Right",
+    "rear_left": "Rear Left",
+    "rear_right": "Rear Right",
+}
+
+SENSORS: tuple[FordSensorEntityDescription, ...] = (
+    _metric(
+        "ambient_temp",
+        "Ambient Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement="°C",
+        suggested_display_precision=1,
+        deadband=0.5,
+    ),
+    _metric(
+        "battery_charge_level",
+        "Battery Charge Level",
+        device_class=SensorDeviceClass.BATTERY,
+        native_unit_of_measurement="%",
+        suggested_display_precision=1,
+        deadband=1.0,
+    ),
+    _metric(
+        "battery_voltage",
+        "Battery Voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement="V",
+        suggested_display_precision=2,
+        deadband=0.05,
+    ),
+    _metric(
+        "fuel_level",
+        "Fuel Level",
+        native_unit_of_measurement="%",
+        suggested_display_precision=0,
+        deadband=1.0,
+        state_class=SensorStateClass.MEASUREMENT,
+        update_fn=fuel_reported,
+        data_paths=("fuel_range", "ignition_status"),
+        restore=True,
+    ),
+    _metric(
+        "fuel_range",
+        "Fuel Range",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement="km",
+        suggested_display_precision=1,
+        deadband=1.0,
+        state_class=SensorStateClass.MEASUREMENT,
+        update_fn=fuel_reported,
+        data_paths=("ignition_status",),
+        restore=True,
+    ),
+    _metric(
+        "odometer",
+        "Odometer",
+        device_class=SensorDeviceClass.DISTANCE,
+        native_unit_of_measurement="km",
+        suggested_display_precision=0,
+        restore=True,
+    ),
+    _metric(
+        "outside_temperature",
+        "Outside Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement="°C",
+        suggested_display_precision=1,
+        deadband=0.5,
+    ),
+    _metric("gear_lever_position", "Gear Lever Position", str.capitalize),
+    _metric("ignition_status", "Ignition Status", str.capitalize),
+    _metric(
+        "engine_coolant_temp",
+        "Engine Coolant Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement="°C",
+        suggested_display_precision=0,
+        deadband=1.0,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    _metric(
+        "oil_life_remaining",
+        "Oil Life Remaining",
+        native_unit_of_measurement="%",
+        suggested_display_precision=0,
+        deadband=1.0,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    *(
+        _metric(
+            f"tires.{tire}.pressure",
+            f"Tire Pressure: {name}",
+            device_class=SensorDeviceClass.PRESSURE,
+            native_unit_of_measurement="bar",
+            suggested_display_precision=1,
+            deadband=0.05,
+        )
+        for tire, name in _CORNERS.items()
+    ),
+    *(
+        # The API reports a window's opening as a lower/upper range; the
+        # upper bound is the conservative reading.
+        _metric(
+            f"windows.{window}.upper",
+            f"Window: {name}",
+            native_unit_of_measurement="%",
+            suggested_display_precision=0,
+        )
+        for window, name in _CORNERS.items()
+    ),
+)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["battery_charge_level"]
-        self.async_write_ha_state()
 
+@dataclass(frozen=True, kw_only=True)
+class FordMetricSensorEntityDescription(SensorEntityDescription):
+    """A diagnostic sensor reporting the integration's own performance."""
+
+    value_fn: Callable[[PollMetrics], StateType | datetime]
+    attributes_fn: Callable[[PollMetrics], dict[str, Any]] | None = None
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    entity_registry_enabled_default: bool = False
+
+
+def _timing(
+    key: str, name: str, histogram: Callable[[PollMetrics], RollingHistogram]
+) -> FordMetricSensorEntityDescription:
+    """Describe a sensor showing the median of a timing histogram in ms."""
+
+    def milliseconds(value: float | None) -> float | None:
+        return None if value is None else round(value * 1000, 1)
+
+    return FordMetricSensorEntityDescription(
+        key=key,
+        name=name,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: milliseconds(histogram(metrics).percentile(0.5)),
+        attributes_fn=lambda metrics: {
+            "p95": milliseconds(histogram(metrics).percentile(0.95)),
+            "max": milliseconds(histogram(metrics).max),
+            "count": histogram(metrics).count,
+        },
+    )
 
-class BatteryVoltageEntity(VehicleEntity, SensorEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Battery Voltage"
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_native_unit_of_measurement = "V"
-    _attr_suggested_display_precision = 2
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["battery_voltage"]
-        self.async_write_ha_state()
+METRIC_SENSORS: tuple[FordMetricSensorEntityDescription, ...] = (
+    _timing("poll_time", "Poll Time", lambda metrics: metrics.poll_time),
+    _timing(
+        "token_refresh_time",
+        "Token Refresh Time",
+        lambda metrics: metrics.token_refresh_time,
+    ),
+    _timing("parse_time", "Parse Time", lambda metrics: metrics.parse_time),
+    FordMetricSensorEntityDescription(
+        key="response_size",
+        name="Response Size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.response_size.last,
+        attributes_fn=lambda metrics: {
+            "total": metrics.response_size.total,
+            "count": metrics.response_size.count,
+        },
+    ),
+    FordMetricSensorEntityDescription(
+        key="rate_limited",
+        name="Rate Limited Responses",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.rate_limited,
+    ),
+    FordMetricSensorEntityDescription(
+        key="failed_polls",
+        name="Failed Polls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.failed_polls,
+    ),
+    FordMetricSensorEntityDescription(
+        key="merged_requests",
+        name="Merged Refresh Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.merged_requests,
+    ),
+    FordMetricSensorEntityDescription(
+        key="last_success",
+        name="Last Successful Poll",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda metrics: metrics.last_success,
+    ),
+)
 
 
-class OdometerEntity(VehicleEntity, RestoreSensor):
+class FordSensorEntity(VehicleEntity, SensorEntity):
     _attr_has_entity_name = True
-    _attr_name = "Odometer"
-    _attr_device_class = SensorDeviceClass.DISTANCE
-    _attr_native_unit_of_measurement = "km"
-    _attr_suggested_display_precision = 0
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["odometer"]
-        self.async_write_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to updates."""
-        await super().async_added_to_hass()
-
-        last_state = await self.async_get_last_sensor_data()
-
-        if self.coordinator.last_update_success:
-            return
-
-        if last_state and last_state.native_value:
-            self._attr_native_value = last_state.native_value
-
-    @property
-    def available(self) -> bool:
-        return super().available or self._attr_native_value is not None
-
+    entity_description: FordSensorEntityDescription
 
-class FuelLevelEntity(VehicleEntity, RestoreSensor):
-    _attr_has_entity_name = True
-    _attr_name = "Fuel Level"
-    _attr_device_class = None
-    _attr_native_unit_of_measurement = "%"
-    _attr_suggested_display_precision = 0
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    def __init__(
+        self,
+        coordinator: MyDataCoordinator,
+        entry: ConfigEntry,
+        description: FordSensorEntityDescription,
+    ) -> None:
+        self.entity_description = description
+        self._data_paths = description.data_paths
+        super().__init__(coordinator, entry)
+        self._attr_name = description.name
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        if (
-            self.coordinator.data["fuel_range"] > 0.0
-            or self.coordinator.data["ignition_status"] == "ON"
-        ):
-            self._attr_native_value = self.coordinator.data["fuel_level"]
+        description = self.entity_description
+        data = self.coordinator.data
+        if description.update_fn is None or description.update_fn(data):
+            value = description.value_fn(data)
+            if not self._within_deadband(value):
+                self._attr_native_value = value
         self.async_write_ha_state()
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to updates."""
-        await super().async_added_to_hass()
-
-        last_state = await self.async_get_last_sensor_data()
-
-        if self.coordinator.last_update_success:
-            return
-
-        if last_state and last_state.native_value:
-            self._attr_native_value = last_state.native_value
-
-    @property
-    def available(self) -> bool:
-        return super().available or self._attr_native_value is not None
-
-
-class FuelRangeEntity(VehicleEntity, RestoreSensor):
-    _attr_has_entity_name = True
-    _attr_name = "Fuel Range"
-    _attr_device_class = SensorDeviceClass.DISTANCE
-    _attr_native_unit_of_measurement = "km"
-    _attr_suggested_display_precision = 1
-    _attr_state_class = SensorStateClass.MEASUREMENT
+    def _within_deadband(self, value: StateType) -> bool:
+        deadband = self.entity_description.deadband
+        current = self._attr_native_value
+        return (
+            deadband is not None
+            and isinstance(value, (int, float))
+            and isinstance(current, (int, float))
+            and abs(value - current) < deadband
+        )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        if (
-            self.coordinator.data["fuel_range"] > 0.0
-            or self.coordinator.data["ignition_status"] == "ON"
-        ):
-            self._attr_native_value = self.coordinator.data["fuel_range"]
-        self.async_write_ha_state()
 
+class FordRestoreSensorEntity(FordSensorEntity, RestoreSensor):
     async def async_added_to_hass(self) -> None:
         """Subscribe to updates."""
         await super().async_added_to_hass()
 
         last_state = await self.async_get_last_sensor_data()
 
-        if self.coordinator.last_update_success:
+        if self.coordinator.data is not None:
             return
 
         if last_state and last_state.native_value:
@@ -153,65 +316,46 @@ class FuelRangeEntity(VehicleEntity, RestoreSensor):
         return super().available or self._attr_native_value is not None
 
 
-class OutsideTemperatureEntity(VehicleEntity, SensorEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Outside Temperature"
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = "°C"
-    _attr_suggested_display_precision = 1
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["outside_temperature"]
-        self.async_write_ha_state()
-
-
-class GearLeverPositionEntity(VehicleEntity, SensorEntity):
+class LastTelemetryEntity(VehicleEntity, SensorEntity):
     _attr_has_entity_name = True
-    _attr_name = "Gear Lever Position"
-    _attr_device_class = None
-    _attr_native_unit_of_measurement = None
+    _attr_name = "Last Telemetry"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data[
-            "gear_lever_position"
-        ].capitalize()
+        self._attr_native_value = self.coordinator.data_updated
         self.async_write_ha_state()
 
 
-class IgnitionStatusEntity(VehicleEntity, SensorEntity):
-    _attr_has_entity_name = True
-    _attr_name = "Ignition Status"
-    _attr_device_class = None
-    _attr_native_unit_of_measurement = None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["ignition_status"].capitalize()
-        self.async_write_ha_state()
-
+class FordMetricSensorEntity(VehicleEntity, SensorEntity):
+    """Performance metric; updated after every poll, changed or not."""
 
-class TirePressureEntity(VehicleEntity, SensorEntity):
     _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.PRESSURE
-    _attr_native_unit_of_measurement = "bar"
-    _attr_suggested_display_precision = 1
+    entity_description: FordMetricSensorEntityDescription
 
     def __init__(
         self,
         coordinator: MyDataCoordinator,
         entry: ConfigEntry,
-        tire: str,
-        friendly_name: str,
+        description: FordMetricSensorEntityDescription,
     ) -> None:
+        self.entity_description = description
         super().__init__(coordinator, entry)
-        self._tire = tire
-        self._attr_name = friendly_name
+        self._attr_name = description.name
+
+    @property
+    def available(self) -> bool:
+        # Failed polls are exactly what some of these sensors report.
+        return True
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._attr_native_value = self.coordinator.data["tires"][self._tire]["pressure"]
+        description = self.entity_description
+        metrics = self.coordinator.metrics
+        self._attr_native_value = description.value_fn(metrics)
+        if description.attributes_fn is not None:
+            self._attr_extra_state_attributes = description.attributes_fn(metrics)
         self.async_write_ha_state()
 
 
@@ -222,29 +366,15 @@ async def async_setup_entry(
 ) -> None:
     data = hass.data[C.DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
-    async_add_entities(
-        [
-            AmbientTempEntity(coordinator, entry),
-            BatteryChargeLevelEntity(coordinator, entry),
-            BatteryVoltageEntity(coordinator, entry),
-            FuelLevelEntity(coordinator, entry),
-            FuelRangeEntity(coordinator, entry),
-            OdometerEntity(coordinator, entry),
-            OutsideTemperatureEntity(coordinator, entry),
-            GearLeverPositionEntity(coordinator, entry),
-            IgnitionStatusEntity(coordinator, entry),
-            TirePressureEntity(
-                coordinator, entry, "front_left", "Tire Pressure: Front Left"
-            ),
-            TirePressureEntity(
-                coordinator, entry, "front_right", "Tire Pressure: Front Right"
-            ),
-            TirePressureEntity(
-                coordinator, entry, "rear_left", "Tire Pressure: Rear Left"
-            ),
-            TirePressureEntity(
-                coordinator, entry, "rear_right", "Tire Pressure: Rear Right"
-            ),
-        ],
-        update_before_add=False,
+    entities: list[SensorEntity] = [
+        (FordRestoreSensorEntity if description.restore else FordSensorEntity)(
+            coordinator, entry, description
+        )
+        for description in SENSORS
+    ]
+    entities.append(LastTelemetryEntity(coordinator, entry))
+    entities.extend(
+        FordMetricSensorEntity(coordinator, entry, description)
+        for description in METRIC_SENSORS
     )
+    async_add_entities(entities, update_before_add=False)
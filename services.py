@@ -0,0 +1,94 @@
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+import voluptuous as vol
+
+from . import const as C
+
+if TYPE_CHECKING:
+    from .coordinator import MyDataCoordinator
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_LIMIT = "limit"
+ATTR_SINCE = "since"
+
+SERVICE_GET_TRACK = "get_track"
+SERVICE_GET_TRIPS = "get_trips"
+
+GET_TRACK_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_SINCE): cv.datetime,
+    }
+)
+GET_TRIPS_SCHEMA = GET_TRACK_SCHEMA
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> "MyDataCoordinator":
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != C.DOMAIN:
+        raise ServiceValidationError(
+            translation_domain=C.DOMAIN,
+            translation_key="entry_not_found",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=C.DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return hass.data[C.DOMAIN][entry_id]["coordinator"]
+
+
+async def _async_get_track(call: ServiceCall) -> ServiceResponse:
+    coordinator = _get_coordinator(call.hass, call)
+    since: Any = call.data.get(ATTR_SINCE)
+    return {
+        "track": coordinator.history.recent(
+            limit=call.data.get(ATTR_LIMIT),
+            # The UI sends a naive time, meant in Home Assistant's zone.
+            since=dt_util.as_utc(since).timestamp() if since is not None else None,
+        )
+    }
+
+
+async def _async_get_trips(call: ServiceCall) -> ServiceResponse:
+    coordinator = _get_coordinator(call.hass, call)
+    since: Any = call.data.get(ATTR_SINCE)
+    return {
+        "trips": coordinator.trips.recent(
+            limit=call.data.get(ATTR_LIMIT),
+            since=dt_util.as_utc(since).timestamp() if since is not None else None,
+        )
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    hass.services.async_register(
+        C.DOMAIN,
+        SERVICE_GET_TRACK,
+        _async_get_track,
+        schema=GET_TRACK_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        C.DOMAIN,
+        SERVICE_GET_TRIPS,
+        _async_get_trips,
+        schema=GET_TRIPS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
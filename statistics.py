@@ -0,0 +1,179 @@
+"""Import odometer, fuel and trip figures into long-term statistics.
+
+Rather than letting the recorder compile statistics from a state written on
+every poll, the readings of each hour are accumulated in memory and
+imported as one external statistics row per figure once the hour is over.
+Figures whose sensors have a state class, such as fuel level, get their
+statistics from the recorder instead and are not imported here.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import UnitOfLength
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+
+from . import const as C
+from .model import VehicleData, path_getter
+
+
+@dataclass(frozen=True, kw_only=True)
+class FordStatisticDescription:
+    key: str
+    name: str
+    value_fn: Callable[[VehicleData], float | None]
+    unit: str | None
+    # Counters such as the odometer are imported as a running sum; all
+    # other figures as an hourly mean, minimum and maximum.
+    has_sum: bool = False
+
+
+def _trip_value(path: str) -> Callable[[VehicleData], float | None]:
+    get = path_getter(path)
+
+    def value_fn(data: VehicleData) -> float | None:
+        value = get(data)
+        return value[1] if value is not None else None
+
+    return value_fn
+
+
+STATISTICS: tuple[FordStatisticDescription, ...] = (
+    FordStatisticDescription(
+        key="odometer",
+        name="Odometer",
+        value_fn=path_getter("odometer"),
+        unit=UnitOfLength.KILOMETERS,
+        has_sum=True,
+    ),
+    FordStatisticDescription(
+        key="trip_fuel_economy",
+        name="Trip Fuel Economy",
+        value_fn=_trip_value("trip_fuel_economy"),
+        unit=None,
+    ),
+    FordStatisticDescription(
+        key="trip_xev_battery_distance",
+        name="Trip Electric Distance",
+        value_fn=_trip_value("trip_xev_battery_distance_accumulated"),
+        unit=UnitOfLength.KILOMETERS,
+    ),
+)
+
+
+class _Accumulator:
+    __slots__ = ("count", "total", "min", "max", "last")
+
+    def __init__(self, value: float) -> None:
+        self.count = 1
+        self.total = self.min = self.max = self.last = value
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+
+
+class StatisticsImporter:
+    """Batch telemetry readings into hourly external statistics."""
+
+    def __init__(self, hass: HomeAssistant, vin: str) -> None:
+        self._hass = hass
+        self._vin = vin
+        self._hour: datetime | None = None
+        self._readings: dict[str, _Accumulator] = {}
+
+    @callback
+    def add(self, data: VehicleData, when: datetime) -> None:
+        hour = when.replace(minute=0, second=0, microsecond=0)
+        if hour != self._hour:
+            self.flush()
+            self._hour = hour
+        for description in STATISTICS:
+            value = description.value_fn(data)
+            if value is None:
+                continue
+            if (readings := self._readings.get(description.key)) is None:
+                self._readings[description.key] = _Accumulator(float(value))
+            else:
+                readings.add(float(value))
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Import each hour once it is over; return a callback that stops it.
+
+        Polls that bring nothing new add no readings, so a parked vehicle
+        would otherwise leave its last hour unimported until the next
+        reading or shutdown.
+        """
+        return async_track_utc_time_change(
+            self._hass, self._async_hour_over, minute=0, second=0
+        )
+
+    @callback
+    def _async_hour_over(self, now: datetime) -> None:
+        if self._hour is not None and self._hour < now.replace(
+            minute=0, second=0, microsecond=0
+        ):
+            self.flush()
+
+    @callback
+    def flush(self) -> None:
+        """Import the readings of the current hour, complete or not.
+
+        A partial hour imported on shutdown is overwritten if more readings
+        for it arrive after a restart.
+        """
+        if self._hour is None or not self._readings:
+            return
+        for description in STATISTICS:
+            readings = self._readings.get(description.key)
+            if readings is None:
+                continue
+            async_add_external_statistics(
+                self._hass,
+                self._metadata(description),
+                [self._row(description, readings)],
+            )
+        self._readings = {}
+
+    def _metadata(self, description: FordStatisticDescription) -> StatisticMetaData:
+        return StatisticMetaData(
+            mean_type=(
+                StatisticMeanType.NONE
+                if description.has_sum
+                else StatisticMeanType.ARITHMETIC
+            ),
+            has_sum=description.has_sum,
+            name=f"Vehicle {self._vin} {description.name}",
+            source=C.DOMAIN,
+            statistic_id=f"{C.DOMAIN}:{self._vin.lower()}_{description.key}",
+            unit_of_measurement=description.unit,
+        )
+
+    def _row(
+        self, description: FordStatisticDescription, readings: _Accumulator
+    ) -> StatisticData:
+        assert self._hour is not None
+        if description.has_sum:
+            return StatisticData(
+                start=self._hour, state=readings.last, sum=readings.last
+            )
+        return StatisticData(
+            start=self._hour,
+            mean=readings.total / readings.count,
+            min=readings.min,
+            max=readings.max,
+        )
@@ -0,0 +1,123 @@
+"""Decode only the wanted metrics of a telemetry body as it arrives.
+
+The decoder follows the JSON structure chunk by chunk without building
+objects. Only the values of wanted members of the top-level ``metrics``
+object are sliced out and handed to the JSON decoder; everything else is
+skipped. Bytes are only kept for the value being captured, or for a string
+split across two chunks, so memory use depends on what is consumed rather
+than on the size of the document.
+"""
+
+from collections.abc import Collection
+import re
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+# Strings are matched whole so that their contents are never mistaken for
+# structure; group 1 is not a quote when a string runs past the buffer.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*(\\?"?)|[{}\[\],:]', re.DOTALL)
+
+_QUOTE = ord('"')
+_COLON = ord(":")
+_COMMA = ord(",")
+_OPEN_OBJECT = ord("{")
+_OPEN_ARRAY = ord("[")
+
+# Depth of the members of the top-level "metrics" object.
+_METRICS_DEPTH = 2
+
+
+class MetricStreamDecoder:
+    """Incrementally pick the wanted metrics out of a telemetry body.
+
+    Feed the body in chunks of any size; once ``done`` is set the metrics
+    object has been read completely and further input is ignored.
+    """
+
+    def __init__(self, wanted: Collection[str]) -> None:
+        self._wanted = {name.encode(): name for name in wanted}
+        self._buffer = bytearray()
+        self._pos = 0
+        self._stack: list[int] = []
+        self._expect_key = False
+        self._key = b""
+        self._in_metrics = False
+        self._capture: str | None = None
+        self._value_start = 0
+        self.done = False
+        self.metrics: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        if self.done:
+            return
+        buffer = self._buffer
+        buffer += chunk
+        stack = self._stack
+        pos = len(buffer)
+
+        for match in _TOKEN.finditer(buffer, self._pos):
+            at = match.start()
+            char = buffer[at]
+            depth = len(stack)
+
+            if char == _QUOTE:
+                if match.group(1) != b'"':
+                    # Wait for the rest of the string.
+                    pos = at
+                    break
+                if self._expect_key and depth <= _METRICS_DEPTH:
+                    self._key = bytes(buffer[at + 1 : match.end() - 1])
+            elif char == _COLON:
+                self._expect_key = False
+                if (
+                    depth == _METRICS_DEPTH
+                    and self._in_metrics
+                    and self._key in self._wanted
+                ):
+                    self._capture = self._wanted[self._key]
+                    self._value_start = at + 1
+            elif char == _COMMA:
+                if depth == _METRICS_DEPTH:
+                    self._end_value(at)
+                self._expect_key = stack[-1] == _OPEN_OBJECT if stack else False
+            elif char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+                if (
+                    char == _OPEN_OBJECT
+                    and depth == _METRICS_DEPTH - 1
+                    and self._key == b"metrics"
+                ):
+                    self._in_metrics = True
+                stack.append(char)
+                self._expect_key = char == _OPEN_OBJECT
+            else:
+                if depth == _METRICS_DEPTH:
+                    self._end_value(at)
+                if stack:
+                    stack.pop()
+                self._expect_key = False
+                if depth == _METRICS_DEPTH and self._in_metrics:
+                    self.done = True
+                    self._buffer = bytearray()
+                    return
+
+        # Drop everything that has been scanned and is not part of a value
+        # being captured.
+        keep = self._value_start if self._capture is not None else pos
+        del buffer[:keep]
+        self._pos = pos - keep
+        self._value_start -= keep
+
+    def _end_value(self, end: int) -> None:
+        if self._capture is None:
+            return
+        self.metrics[self._capture] = json_loads(
+            bytes(self._buffer[self._value_start : end])
+        )
+        self._capture = None
+
+    def result(self) -> dict[str, Any]:
+        """Return the wanted metrics found in a complete body."""
+        if not self.done:
+            raise ValueError("Telemetry body ended before its metrics object")
+        return self.metrics
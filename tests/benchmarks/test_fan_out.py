@@ -0,0 +1,76 @@
+"""A coordinator update through every entity of the integration."""
+
+import copy
+from itertools import cycle
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from conftest import C, VIN, telemetry
+from custom_components.fordconnect.coordinator import MyDataCoordinator
+from custom_components.fordconnect.model import parse_api_response
+
+ROUNDS = 200
+
+
+def _bumped(value: Any) -> Any:
+    """Return ``value`` with every number in it increased by one."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, dict, list)):
+        return value
+    if isinstance(value, dict):
+        return {key: _bumped(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_bumped(item) for item in value]
+    return value + 1
+
+
+def _moved(response: dict[str, Any]) -> dict[str, Any]:
+    """Return the response with the value of every numeric metric changed."""
+    moved = copy.deepcopy(response)
+    for metric in moved["metrics"].values():
+        for item in metric if isinstance(metric, list) else (metric,):
+            if isinstance(item, dict) and "value" in item:
+                item["value"] = _bumped(item["value"])
+    return moved
+
+
+# Recording every state written would time the recorder thread instead.
+@pytest.mark.parametrize(
+    "recorder_config", [{"exclude": {"entity_globs": [f"*.vehicle_{VIN.lower()}_*"]}}]
+)
+async def test_fan_out(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    benchmark: BenchmarkFixture,
+) -> None:
+    """Alternate two snapshots, so that every update wakes the entities."""
+    coordinator: MyDataCoordinator = hass.data[C.DOMAIN][init_integration.entry_id][
+        "coordinator"
+    ]
+    response = telemetry("ice")
+    snapshots = cycle(
+        (parse_api_response(_moved(response)), parse_api_response(response))
+    )
+    written = 0
+
+    def count_writes(_event: object) -> None:
+        nonlocal written
+        written += 1
+
+    unsub = hass.bus.async_listen("state_changed", count_writes)
+
+    def update() -> None:
+        coordinator.async_set_updated_data(next(snapshots))
+
+    benchmark.pedantic(update, rounds=ROUNDS, warmup_rounds=2)
+    await hass.async_block_till_done()
+
+    written = 0
+    update()
+    await hass.async_block_till_done()
+    unsub()
+    assert written >= 10
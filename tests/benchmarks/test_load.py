@@ -0,0 +1,200 @@
+"""Many simulated vehicles polled through the integration against the stub.
+
+Every vehicle is a config entry of its own, authorized by its own account,
+and goes through the real token refresh, FordAPI, MyDataCoordinator and
+entity platforms. The run reports throughput, poll latency and how late the
+event loop runs, to size how many vehicles one instance can handle:
+
+    pytest tests/benchmarks/test_load.py --load-vehicles 500 --load-duration 60
+
+By default it runs a small fleet for a few seconds, as a smoke test.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+
+from conftest import C, register_stub_implementation, telemetry
+from custom_components.fordconnect.coordinator import MyDataCoordinator
+from custom_components.fordconnect.metrics import RollingHistogram
+from stub_server import DrivingVehicle, FordStub, access_token, refresh_token
+
+# How often the event loop is checked for lag, in seconds.
+LAG_PROBE = 0.05
+
+
+@dataclass
+class LoadReport:
+    vehicles: int
+    duration: float
+    setup_time: float
+    polls: int
+    failed_polls: int
+    requests: int
+    faults: int
+    token_requests: int
+    state_writes: int
+    poll_time: RollingHistogram
+    loop_lag: RollingHistogram
+
+    def lines(self) -> list[str]:
+        def ms(histogram: RollingHistogram, q: float) -> str:
+            value = histogram.percentile(q)
+            return "-" if value is None else f"{value * 1000:.1f} ms"
+
+        return [
+            f"{self.vehicles} vehicles for {self.duration:.0f} s, "
+            f"set up in {self.setup_time:.2f} s",
+            f"polls: {self.polls} ok, {self.failed_polls} failed, "
+            f"{self.polls / self.duration:.1f}/s",
+            f"requests: {self.requests} telemetry ({self.faults} faults), "
+            f"{self.token_requests} token",
+            f"state writes: {self.state_writes / self.duration:.0f}/s",
+            "poll latency: "
+            + ", ".join(
+                f"p{round(q * 100)} {ms(self.poll_time, q)}" for q in (0.5, 0.95, 0.99)
+            ),
+            f"loop lag: p50 {ms(self.loop_lag, 0.5)}, p99 {ms(self.loop_lag, 0.99)}, "
+            f"max {ms(self.loop_lag, 1)}",
+        ]
+
+
+def _fleet_entry(
+    hass: HomeAssistant, stub: FordStub, index: int, interval: float
+) -> MockConfigEntry:
+    vin = f"WF0XXXTTGXL{index:06d}"
+    stub.add_vehicle(vin, DrivingVehicle(telemetry("hybrid"), step=interval))
+    # One account per vehicle, each with its own request budget.
+    implementation = f"stub_{vin.lower()}"
+    register_stub_implementation(hass, stub, implementation)
+    entry = MockConfigEntry(
+        domain=C.DOMAIN,
+        title=f"Vehicle {vin}",
+        unique_id=vin,
+        data={
+            "auth_implementation": implementation,
+            C.VIN: vin,
+            # Expired, so that every vehicle starts with a token refresh.
+            "token": {
+                "access_token": access_token(vin),
+                "refresh_token": refresh_token(vin),
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "expires_at": time.time() - 1,
+            },
+        },
+        options={C.CONF_MIN_INTERVAL: interval, C.CONF_MAX_INTERVAL: interval},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def _watch_loop(duration: float) -> RollingHistogram:
+    """Return how late the event loop wakes up a sleeper, over ``duration``."""
+    loop = asyncio.get_running_loop()
+    lag = RollingHistogram(window=round(duration / LAG_PROBE) + 1)
+    end = loop.time() + duration
+    while (now := loop.time()) < end:
+        await asyncio.sleep(LAG_PROBE)
+        lag.add(loop.time() - now - LAG_PROBE)
+    return lag
+
+
+async def run_fleet(
+    hass: HomeAssistant,
+    stub: FordStub,
+    vehicles: int,
+    duration: float,
+    interval: float,
+) -> LoadReport:
+    """Set up ``vehicles`` entries, let them poll for ``duration`` and unload."""
+    entries = [_fleet_entry(hass, stub, index, interval) for index in range(vehicles)]
+    state_writes = 0
+
+    @callback
+    def count_write(_event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+    started = time.perf_counter()
+    assert await async_setup_component(
+        hass, C.DOMAIN, {C.DOMAIN: {C.CONF_API_URL: stub.url}}
+    )
+    setup_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    loop_lag = await _watch_loop(duration)
+    elapsed = time.perf_counter() - started
+
+    coordinators: list[MyDataCoordinator] = [
+        hass.data[C.DOMAIN][entry.entry_id]["coordinator"] for entry in entries
+    ]
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    unsub()
+
+    polls = sum(coordinator.metrics.poll_time.count for coordinator in coordinators)
+    poll_time = RollingHistogram(window=max(1, polls))
+    for coordinator in coordinators:
+        for sample in coordinator.metrics.poll_time:
+            poll_time.add(sample)
+    return LoadReport(
+        vehicles=vehicles,
+        duration=elapsed,
+        setup_time=setup_time,
+        polls=polls,
+        failed_polls=sum(
+            coordinator.metrics.failed_polls for coordinator in coordinators
+        ),
+        requests=stub.telemetry_requests,
+        faults=stub.faults_served,
+        token_requests=stub.token_requests,
+        state_writes=state_writes,
+        poll_time=poll_time,
+        loop_lag=loop_lag,
+    )
+
+
+async def test_load(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    socket_enabled: None,
+    pytestconfig: pytest.Config,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    option = pytestconfig.getoption
+    stub = FordStub()
+    stub.latency = option("load_latency")
+    stub.fault_rate = option("load_fault_rate")
+    await stub.start()
+    try:
+        report = await run_fleet(
+            hass,
+            stub,
+            option("load_vehicles"),
+            option("load_duration"),
+            option("load_interval"),
+        )
+    finally:
+        await stub.stop()
+
+    with capsys.disabled():
+        print("", *report.lines(), sep="\n")
+
+    # Every vehicle refreshed its token, and every request answered without
+    # a fault made a successful poll.
+    assert report.token_requests >= report.vehicles
+    assert report.polls > 0
+    assert report.polls == report.requests - report.faults
+    assert report.failed_polls >= report.faults
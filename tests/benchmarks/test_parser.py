@@ -0,0 +1,76 @@
+"""Telemetry parsing throughput and the memory a retained snapshot costs."""
+
+from collections.abc import Callable
+import gc
+import tracemalloc
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from conftest import TELEMETRY, telemetry
+from custom_components.fordconnect.model import parse_api_response
+import original_parser
+
+RETAINED = 200
+
+# Bytes per parsed snapshot, with some headroom; the coordinator, the
+# entity fan-out and the snapshot store each keep snapshots alive.
+SNAPSHOT_BYTES_LIMIT = 2_500
+
+
+@pytest.mark.parametrize("name", TELEMETRY)
+def test_parse(benchmark: BenchmarkFixture, name: str) -> None:
+    response = telemetry(name)
+    errors: list[str] = []
+
+    def parse() -> Any:
+        errors.clear()
+        return parse_api_response(response, errors)
+
+    data = benchmark(parse)
+    assert (data["odometer"] is None) == (name == "missing")
+
+
+@pytest.mark.parametrize("name", ["hybrid", "large"])
+def test_parse_original(benchmark: BenchmarkFixture, name: str) -> None:
+    """The parser the field table replaced, on the fixtures it can read."""
+    response = telemetry(name)
+    benchmark(original_parser.parse_api_response, response)
+
+
+def _retained_size(
+    parse: Callable[[dict[str, Any]], Any], response: dict[str, Any]
+) -> float:
+    """Return the bytes each of RETAINED parsed snapshots keeps allocated."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        snapshots = [parse(response) for _ in range(RETAINED)]
+        size = (tracemalloc.get_traced_memory()[0] - before) / RETAINED
+    finally:
+        tracemalloc.stop()
+    del snapshots
+    return size
+
+
+@pytest.mark.parametrize(
+    ("parse", "limit"),
+    [
+        pytest.param(parse_api_response, SNAPSHOT_BYTES_LIMIT, id="records"),
+        # The nested dicts VehicleData was made of before it became records.
+        pytest.param(original_parser.parse_api_response, None, id="dicts"),
+    ],
+)
+def test_snapshot_memory(
+    benchmark: BenchmarkFixture,
+    parse: Callable[[dict[str, Any]], Any],
+    limit: int | None,
+) -> None:
+    response = telemetry("hybrid")
+    size = _retained_size(parse, response)
+    benchmark.extra_info["bytes_per_snapshot"] = round(size)
+    benchmark(lambda: [parse(response) for _ in range(RETAINED)])
+    if limit is not None:
+        assert size < limit
@@ -0,0 +1,85 @@
+"""Streaming decode against buffering and decoding whole telemetry bodies."""
+
+from collections.abc import Callable
+import gc
+import tracemalloc
+from typing import Any
+
+import orjson
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from conftest import telemetry
+from custom_components.fordconnect.model import USED_METRICS
+from custom_components.fordconnect.streaming import MetricStreamDecoder
+from homeassistant.util.json import json_loads
+
+CHUNK_SIZE = 64 * 1024
+# Copies of the largest metric of the large fixture, which the integration
+# does not read, added under new names: about 0.04, 1.5 and 6 MB bodies.
+PADDING = (0, 100, 400)
+PADDED_METRIC = "customMetrics"
+
+Chunks = list[bytes]
+
+
+def _chunks(padding: int) -> Chunks:
+    """Return a synthetic telemetry body as it arrives, in chunks."""
+    response = telemetry("large")
+    metrics = response["metrics"]
+    for index in range(padding):
+        metrics[f"unusedMetric{index}"] = metrics[PADDED_METRIC]
+    body = orjson.dumps(response)
+    return [body[at : at + CHUNK_SIZE] for at in range(0, len(body), CHUNK_SIZE)]
+
+
+def _buffered(chunks: Chunks) -> dict[str, Any]:
+    """What get_telemetry does by default: read the body, then decode it."""
+    return json_loads(b"".join(chunks))["metrics"]
+
+
+def _streamed(chunks: Chunks) -> dict[str, Any]:
+    decoder = MetricStreamDecoder(USED_METRICS)
+    for chunk in chunks:
+        decoder.feed(chunk)
+    return decoder.result()
+
+
+def _peak_size(decode: Callable[[Chunks], Any], chunks: Chunks) -> int:
+    """Return the most bytes allocated at once while decoding."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        decode(chunks)
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("decode", [_buffered, _streamed], ids=["buffered", "streamed"])
+@pytest.mark.parametrize("padding", PADDING)
+def test_decode(
+    benchmark: BenchmarkFixture,
+    decode: Callable[[Chunks], dict[str, Any]],
+    padding: int,
+) -> None:
+    chunks = _chunks(padding)
+    benchmark.extra_info["body_bytes"] = sum(map(len, chunks))
+    benchmark.extra_info["peak_bytes"] = _peak_size(decode, chunks)
+    metrics = benchmark(decode, chunks)
+    expected = _buffered(chunks)
+    for name in USED_METRICS & expected.keys():
+        assert metrics[name] == expected[name]
+
+
+def test_streamed_memory_is_flat() -> None:
+    """Streaming memory does not grow with the body, unlike buffering.
+
+    Streaming is several times slower than orjson, as it tokenizes the
+    whole body in Python; test_decode times both.
+    """
+    small, large = _chunks(PADDING[0]), _chunks(PADDING[-1])
+    streamed = _peak_size(_streamed, large)
+    assert streamed < _peak_size(_streamed, small) + CHUNK_SIZE
+    assert streamed * 10 < _peak_size(_buffered, large)
@@ -0,0 +1,159 @@
+"""Fixtures for the fordconnect tests and benchmarks."""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import (
+    RecorderInstanceContextManager,
+)
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.config_entry_oauth2_flow import (
+    LocalOAuth2Implementation,
+    async_register_implementation,
+)
+from homeassistant.setup import async_setup_component
+from homeassistant.util.json import json_loads
+
+# The repository is the integration itself, while Home Assistant loads
+# custom integrations from a custom_components package. Link the repository
+# into one under a temporary directory.
+ROOT = Path(__file__).parents[1]
+FIXTURES = Path(__file__).parent / "fixtures"
+_LINKS = Path(tempfile.mkdtemp(prefix="fordconnect-tests-"))
+(_LINKS / "custom_components").mkdir()
+(_LINKS / "custom_components" / "fordconnect").symlink_to(
+    ROOT, target_is_directory=True
+)
+sys.path.insert(0, str(_LINKS))
+
+from custom_components.fordconnect import const as C  # noqa: E402
+from stub_server import (  # noqa: E402
+    CLIENT_ID,
+    CLIENT_SECRET,
+    FordStub,
+    access_token,
+    refresh_token,
+)
+
+VIN = "WF0XXXTTGXAA00001"
+
+# Anonymized telemetry bodies, see tests/fixtures.
+TELEMETRY = ("ice", "hybrid", "missing", "large")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("fordconnect", "fleet load test, see test_load.py")
+    group.addoption("--load-vehicles", type=int, default=20, help="vehicles")
+    group.addoption(
+        "--load-duration", type=float, default=5.0, help="seconds of polling"
+    )
+    group.addoption(
+        "--load-interval", type=float, default=5.0, help="poll interval in seconds"
+    )
+    group.addoption(
+        "--load-latency", type=float, default=0.05, help="stub latency in seconds"
+    )
+    group.addoption(
+        "--load-fault-rate",
+        type=float,
+        default=0.05,
+        help="fraction of telemetry requests answered with a fault",
+    )
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    shutil.rmtree(_LINKS, ignore_errors=True)
+
+
+def telemetry_body(name: str) -> bytes:
+    """Return a fixture telemetry body as it comes off the wire."""
+    return (FIXTURES / f"telemetry_{name}.json").read_bytes()
+
+
+def telemetry(name: str) -> dict[str, Any]:
+    return json_loads(telemetry_body(name))
+
+
+def register_stub_implementation(
+    hass: HomeAssistant, stub: FordStub, name: str
+) -> None:
+    """Make ``name`` an OAuth2 implementation refreshing tokens at the stub."""
+    async_register_implementation(
+        hass,
+        C.DOMAIN,
+        LocalOAuth2Implementation(
+            hass,
+            name,
+            CLIENT_ID,
+            CLIENT_SECRET,
+            f"{stub.url}/authorize",
+            f"{stub.url}/token",
+        ),
+    )
+
+
+@pytest.fixture
+def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Prepare the recorder, a dependency of the integration, before hass."""
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=C.DOMAIN,
+        title=f"Vehicle {VIN}",
+        unique_id=VIN,
+        data={
+            "auth_implementation": C.DOMAIN,
+            C.VIN: VIN,
+            "token": {
+                "access_token": access_token(VIN),
+                "refresh_token": refresh_token(VIN),
+                "token_type": "Bearer",
+                "expires_in": 3600,
+                "expires_at": time.time() + 3600,
+            },
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def ford_stub(socket_enabled: None) -> AsyncGenerator[FordStub]:
+    """Run a local Ford API serving the ICE fixture for VIN."""
+    stub = FordStub()
+    stub.add_vehicle(VIN, telemetry_body("ice"))
+    await stub.start()
+    yield stub
+    await stub.stop()
+
+
+@pytest.fixture
+async def init_integration(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    config_entry: MockConfigEntry,
+    ford_stub: FordStub,
+) -> AsyncGenerator[MockConfigEntry]:
+    """Set up the integration against the stub and run its first refresh."""
+    register_stub_implementation(hass, ford_stub, C.DOMAIN)
+    assert await async_setup_component(
+        hass, C.DOMAIN, {C.DOMAIN: {C.CONF_API_URL: ford_stub.url}}
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+    yield config_entry
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
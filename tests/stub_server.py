@@ -0,0 +1,262 @@
+"""A local stand-in for the Ford Connect Query API and its token endpoint."""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Mapping
+import copy
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from email.utils import formatdate, parsedate_to_datetime
+import random
+from typing import Any
+
+from aiohttp import hdrs, web
+
+from homeassistant.helpers.json import json_bytes
+
+# The stub serves plain HTTP on the loopback interface, the only address
+# the test sockets may connect to.
+HOST = "127.0.0.1"
+
+CLIENT_ID = "client-id"
+CLIENT_SECRET = "client-secret"
+TOKEN_LIFETIME = 3600
+# Last-Modified of the first body served for a vehicle; each new body is a
+# second later.
+MODIFIED_EPOCH = 1_790_000_000
+
+
+def access_token(vin: str) -> str:
+    return f"token-{vin}"
+
+
+def refresh_token(vin: str) -> str:
+    return f"refresh-{vin}"
+
+
+@dataclass(frozen=True)
+class Reply:
+    """A scripted answer to a telemetry request.
+
+    Without a status or body it is the vehicle's own telemetry, only late.
+    """
+
+    status: int = 200
+    body: bytes | None = None
+    headers: Mapping[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+
+def rate_limited(retry_after: float) -> Reply:
+    return Reply(429, b"", {hdrs.RETRY_AFTER: f"{retry_after:g}"})
+
+
+def server_error(status: int = 503) -> Reply:
+    return Reply(status, b"")
+
+
+# Cut off in the middle of the metrics object.
+MALFORMED = Reply(body=b'{"metrics": {"odometer": {"value": 238')
+
+
+class DrivingVehicle:
+    """Telemetry of a vehicle driving north at a steady speed.
+
+    Every request moves it on by ``step`` seconds of driving, updating the
+    odometer, position and speed along with their update times.
+    """
+
+    def __init__(
+        self, response: dict[str, Any], speed: float = 50.0, step: float = 15.0
+    ) -> None:
+        self._response = copy.deepcopy(response)
+        self._metrics = self._response["metrics"]
+        self._metrics["ignitionStatus"]["value"] = "ON"
+        self._metrics["gearLeverPosition"]["value"] = "DRIVE"
+        self._metrics["speed"]["value"] = speed
+        self._distance = speed * step / 3600
+        self._step = timedelta(seconds=step)
+        self._time = datetime.fromisoformat(self._response["updateTime"])
+
+    def __call__(self) -> bytes:
+        self._time += self._step
+        stamp = self._time.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        metrics = self._metrics
+        metrics["odometer"]["value"] = round(
+            metrics["odometer"]["value"] + self._distance, 1
+        )
+        # About 111 km per degree of latitude.
+        metrics["position"]["value"]["location"]["lat"] += self._distance / 111
+        for name in ("odometer", "position", "speed"):
+            metrics[name]["updateTime"] = stamp
+        self._response["updateTime"] = stamp
+        return json_bytes(self._response)
+
+
+class FordStub:
+    """Serve garage, telemetry and token requests for a set of vehicles.
+
+    Each vehicle is identified by its own access token, as a Ford account
+    authorizes one vehicle per token. Refreshing a vehicle's token revokes
+    the access tokens issued before.
+
+    Telemetry requests can be answered with scripted replies, queued per
+    vehicle, or with faults picked at random at ``fault_rate``. ``latency``
+    delays every response.
+
+    With ``etag`` or ``last_modified`` set, telemetry carries that validator
+    and a request whose validator still matches gets a 304.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self._bodies: dict[str, bytes | Callable[[], bytes]] = {}
+        self._vins: dict[str, str] = {}
+        self._refresh_tokens: dict[str, str] = {}
+        self._issued: dict[str, int] = {}
+        self._scripts: dict[str, deque[Reply]] = {}
+        # The last body served for each vehicle and how many differed.
+        self._served: dict[str, bytes] = {}
+        self._versions: dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+        self.latency = 0.0
+        self.fault_rate = 0.0
+        self.etag = False
+        self.last_modified = False
+        self.faults: tuple[Reply, ...] = (
+            rate_limited(1),
+            server_error(),
+            MALFORMED,
+        )
+        self.telemetry_requests = 0
+        self.token_requests = 0
+        self.faults_served = 0
+        self.not_modified = 0
+        # The client address of every request, to tell new connections
+        # from reused ones.
+        self.peers: list[tuple[str, int]] = []
+
+        self.app = web.Application()
+        self.app.router.add_get("/garage", self._garage)
+        self.app.router.add_get("/telemetry", self._telemetry)
+        self.app.router.add_post("/token", self._token)
+
+    def add_vehicle(self, vin: str, body: bytes | Callable[[], bytes]) -> None:
+        """Serve ``body``, or what it returns on each request, for ``vin``."""
+        self._vins[f"Bearer {access_token(vin)}"] = vin
+        self._refresh_tokens[refresh_token(vin)] = vin
+        self._bodies[vin] = body
+
+    def script(self, vin: str, *replies: Reply) -> None:
+        """Answer the next telemetry requests for ``vin`` with ``replies``."""
+        self._scripts.setdefault(vin, deque()).extend(replies)
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, HOST, 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{HOST}:{port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _vin(self, request: web.Request) -> str:
+        assert request.transport is not None
+        self.peers.append(request.transport.get_extra_info("peername")[:2])
+        vin = self._vins.get(request.headers.get(hdrs.AUTHORIZATION, ""))
+        if vin is None:
+            raise web.HTTPUnauthorized
+        return vin
+
+    def _next_reply(self, vin: str) -> Reply | None:
+        if script := self._scripts.get(vin):
+            return script.popleft()
+        if self.fault_rate and self._random.random() < self.fault_rate:
+            return self._random.choice(self.faults)
+        return None
+
+    async def _garage(self, request: web.Request) -> web.Response:
+        vin = self._vin(request)
+        await asyncio.sleep(self.latency)
+        return web.json_response({"vin": vin})
+
+    async def _telemetry(self, request: web.Request) -> web.Response:
+        vin = self._vin(request)
+        self.telemetry_requests += 1
+        reply = self._next_reply(vin) or Reply()
+        await asyncio.sleep(self.latency + reply.delay)
+        if reply.body is None and reply.status == 200:
+            body = self._bodies[vin]
+            if callable(body):
+                body = body()
+            headers = self._validators(vin, body)
+            if self._still_valid(request, headers):
+                self.not_modified += 1
+                return web.Response(status=304, headers=headers)
+            return web.Response(
+                body=body, headers=headers, content_type="application/json"
+            )
+        self.faults_served += 1
+        return web.Response(
+            status=reply.status,
+            body=reply.body,
+            headers=reply.headers,
+            content_type="application/json",
+        )
+
+    def _validators(self, vin: str, body: bytes) -> dict[str, str]:
+        if body != self._served.get(vin):
+            self._served[vin] = body
+            self._versions[vin] = self._versions.get(vin, 0) + 1
+        version = self._versions[vin]
+        headers = {}
+        if self.etag:
+            headers[hdrs.ETAG] = f'"{vin}-{version}"'
+        if self.last_modified:
+            headers[hdrs.LAST_MODIFIED] = formatdate(
+                MODIFIED_EPOCH + version, usegmt=True
+            )
+        return headers
+
+    @staticmethod
+    def _still_valid(request: web.Request, headers: dict[str, str]) -> bool:
+        if (etag := headers.get(hdrs.ETAG)) and hdrs.IF_NONE_MATCH in request.headers:
+            return request.headers[hdrs.IF_NONE_MATCH] == etag
+        if (modified := headers.get(hdrs.LAST_MODIFIED)) and (
+            since := request.headers.get(hdrs.IF_MODIFIED_SINCE)
+        ):
+            return parsedate_to_datetime(modified) <= parsedate_to_datetime(since)
+        return False
+
+    async def _token(self, request: web.Request) -> web.Response:
+        self.token_requests += 1
+        form = await request.post()
+        await asyncio.sleep(self.latency)
+        vin = self._refresh_tokens.get(str(form.get("refresh_token")))
+        if (
+            form.get("grant_type") != "refresh_token"
+            or form.get("client_id") != CLIENT_ID
+            or form.get("client_secret") != CLIENT_SECRET
+            or vin is None
+        ):
+            return web.json_response({"error": "invalid_grant"}, status=400)
+
+        self._issued[vin] = issued = self._issued.get(vin, 0) + 1
+        token = f"{access_token(vin)}-{issued}"
+        self._vins = {
+            header: owner for header, owner in self._vins.items() if owner != vin
+        }
+        self._vins[f"Bearer {token}"] = vin
+        return web.json_response(
+            {
+                "access_token": token,
+                "refresh_token": refresh_token(vin),
+                "token_type": "Bearer",
+                "expires_in": TOKEN_LIFETIME,
+            }
+        )
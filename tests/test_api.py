@@ -0,0 +1,88 @@
+"""The Query API client against the stub API."""
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+
+from conftest import VIN, C, telemetry, telemetry_body
+from custom_components.fordconnect.api import FordAPI
+from stub_server import DrivingVehicle, FordStub, access_token
+
+POLLS = 5
+
+
+async def test_polls_reuse_one_connection(
+    hass: HomeAssistant, init_integration: MockConfigEntry, ford_stub: FordStub
+) -> None:
+    """Every poll, and the garage lookup, goes over the same keep-alive socket."""
+    runtime = hass.data[C.DOMAIN][init_integration.entry_id]
+    coordinator = runtime["coordinator"]
+    api: FordAPI = runtime["api"]
+    for _ in range(POLLS - 1):
+        assert coordinator.update_interval is not None
+        async_fire_time_changed(hass, dt_util.utcnow() + coordinator.update_interval)
+        await hass.async_block_till_done()
+    assert await api.get_garage() == {"vin": VIN}
+
+    assert ford_stub.telemetry_requests == POLLS
+    assert len(ford_stub.peers) == POLLS + 1
+    assert len(set(ford_stub.peers)) == 1
+
+
+@pytest.fixture
+async def api(hass: HomeAssistant, ford_stub: FordStub) -> FordAPI:
+    return FordAPI(async_get_clientsession(hass), access_token(VIN), ford_stub.url)
+
+
+@pytest.mark.parametrize("validator", ["etag", "last_modified"])
+async def test_validator_not_modified(
+    api: FordAPI, ford_stub: FordStub, validator: str
+) -> None:
+    """A validator that still matches gets a 304, which skips decoding."""
+    setattr(ford_stub, validator, True)
+
+    assert await api.get_telemetry() is not None
+    assert await api.get_telemetry() is None
+    assert ford_stub.not_modified == 1
+    assert api.stats.not_modified == 1
+    assert api.stats.last_bytes == 0
+
+    ford_stub.add_vehicle(VIN, DrivingVehicle(telemetry("ice")))
+    assert await api.get_telemetry() is not None
+    assert ford_stub.not_modified == 1
+
+
+@pytest.mark.parametrize(
+    ("name", "skipped"),
+    [("ice", True), ("hybrid", True), ("large", True), ("missing", False)],
+)
+async def test_unchanged_snapshot_skipped(
+    api: FordAPI, ford_stub: FordStub, name: str, skipped: bool
+) -> None:
+    """Without validators, unchanged metric timestamps skip parsing.
+
+    The missing fixture has a metric without a timestamp, whose value could
+    change unnoticed, so it is always parsed.
+    """
+    ford_stub.add_vehicle(VIN, telemetry_body(name))
+
+    assert await api.get_telemetry() is not None
+    assert (await api.get_telemetry() is None) == skipped
+    assert api.stats.unchanged == int(skipped)
+
+
+async def test_changed_snapshot_parsed(api: FordAPI, ford_stub: FordStub) -> None:
+    ford_stub.add_vehicle(VIN, DrivingVehicle(telemetry("large")))
+
+    first = await api.get_telemetry()
+    second = await api.get_telemetry()
+
+    assert first is not None and second is not None
+    assert second["odometer"] > first["odometer"]
+    assert api.stats.unchanged == 0
@@ -0,0 +1,170 @@
+"""Polling behaviour of the coordinator against the stub API."""
+
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util.json import json_loads
+
+from conftest import VIN, C
+from custom_components.fordconnect.coordinator import MyDataCoordinator
+from custom_components.fordconnect.ratelimit import AccountLimiter
+from custom_components.fordconnect.vehicle_entity import VehicleEntity
+from stub_server import (
+    MALFORMED,
+    FordStub,
+    Reply,
+    access_token,
+    rate_limited,
+    server_error,
+)
+
+
+def _coordinator(hass: HomeAssistant, entry: MockConfigEntry) -> MyDataCoordinator:
+    return hass.data[C.DOMAIN][entry.entry_id]["coordinator"]
+
+
+async def test_requested_refresh_reuses_recent_poll(
+    hass: HomeAssistant, init_integration: MockConfigEntry, ford_stub: FordStub
+) -> None:
+    coordinator = _coordinator(hass, init_integration)
+    assert ford_stub.telemetry_requests == 1
+
+    await coordinator.async_request_refresh()
+    await hass.async_block_till_done()
+
+    assert ford_stub.telemetry_requests == 1
+    assert coordinator.metrics.merged_requests == 1
+
+
+async def test_scheduled_refresh_always_polls(
+    hass: HomeAssistant, init_integration: MockConfigEntry, ford_stub: FordStub
+) -> None:
+    """A short interval must not fall inside the window of the last poll."""
+    coordinator = _coordinator(hass, init_integration)
+    assert coordinator.update_interval is not None
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + coordinator.update_interval + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+    assert ford_stub.telemetry_requests == 2
+    assert coordinator.metrics.merged_requests == 0
+
+
+async def _scheduled_refresh(
+    hass: HomeAssistant, coordinator: MyDataCoordinator
+) -> None:
+    assert coordinator.update_interval is not None
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + coordinator.update_interval + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize(
+    ("reply", "rate_limited_count", "failure_count"),
+    [(rate_limited(120), 1, 0), (server_error(), 0, 1), (MALFORMED, 0, 0)],
+    ids=["429", "503", "malformed"],
+)
+async def test_failed_poll(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    ford_stub: FordStub,
+    reply: Reply,
+    rate_limited_count: int,
+    failure_count: int,
+) -> None:
+    """Faults fail the poll and keep the data; 429 holds back the account."""
+    coordinator = _coordinator(hass, init_integration)
+    limiter: AccountLimiter = hass.data[C.DOMAIN][init_integration.entry_id]["limiter"]
+    data = coordinator.data
+    ford_stub.script(VIN, reply)
+
+    await _scheduled_refresh(hass, coordinator)
+
+    assert ford_stub.faults_served == 1
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert coordinator.data is data
+    assert coordinator.metrics.failed_polls == 1
+    assert limiter.rate_limited_count == rate_limited_count
+    assert limiter.failure_count == failure_count
+    assert (limiter.blocked_for() > 100) == (reply.status == 429)
+
+
+async def test_token_refreshed_at_stub(
+    hass: HomeAssistant, init_integration: MockConfigEntry, ford_stub: FordStub
+) -> None:
+    """A refreshed token is stored and used; the old one is revoked."""
+    coordinator = _coordinator(hass, init_integration)
+    await hass.data[C.DOMAIN][init_integration.entry_id]["tokens"].async_refresh()
+
+    assert ford_stub.token_requests == 1
+    token = init_integration.data["token"]["access_token"]
+    assert token != access_token(VIN)
+
+    await _scheduled_refresh(hass, coordinator)
+
+    assert ford_stub.telemetry_requests == 2
+    assert coordinator.last_update_success
+
+
+async def test_snapshot_restored(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    ford_stub: FordStub,
+    hass_storage: dict[str, Any],
+) -> None:
+    runtime = hass.data[C.DOMAIN][init_integration.entry_id]
+    polled = runtime["coordinator"].data
+    key = f"{C.DOMAIN}.{init_integration.entry_id}"
+    snapshot = json_loads(json_dumps(runtime["coordinator"]._snapshot()))
+
+    def load(stored: dict[str, Any]) -> MyDataCoordinator:
+        # A new coordinator, as after a restart, so that its store reads
+        # the stored data rather than the save still pending.
+        hass_storage[key] = {"version": 1, "key": key, "data": stored}
+        return MyDataCoordinator(
+            hass,
+            runtime["tokens"],
+            runtime["api"],
+            runtime["limiter"],
+            init_integration,
+        )
+
+    coordinator = load(snapshot)
+    await coordinator.async_load_snapshot()
+    assert coordinator.restored
+    assert coordinator.data == polled
+    assert coordinator.data is not polled
+
+    # A snapshot stored with other fields is ignored rather than restored.
+    del snapshot["data"]["doors"]["tailgate"]
+    coordinator = load(snapshot)
+    await coordinator.async_load_snapshot()
+    assert not coordinator.restored
+    assert coordinator.data is None
+
+    # Restored data is available until the first poll, and like polled
+    # data only while polls succeed after that.
+    coordinator = load(json_loads(json_dumps(runtime["coordinator"]._snapshot())))
+    await coordinator.async_load_snapshot()
+    entity = VehicleEntity(coordinator, init_integration)
+    assert entity.available
+    ford_stub.script(VIN, server_error())
+    await coordinator.async_refresh()
+    assert not coordinator.restored
+    assert not entity.available
+    await coordinator.async_refresh()
+    assert entity.available
@@ -0,0 +1,76 @@
+"""The vehicle position entity."""
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from conftest import C, VIN, telemetry
+from custom_components.fordconnect.coordinator import MyDataCoordinator
+from custom_components.fordconnect.device_tracker import ESTIMATE_INTERVAL
+from custom_components.fordconnect.model import VehicleData, parse_api_response
+
+ENTITY_ID = f"device_tracker.vehicle_{VIN.lower()}_vehicle_position"
+
+
+def _coordinator(hass: HomeAssistant, entry: MockConfigEntry) -> MyDataCoordinator:
+    return hass.data[C.DOMAIN][entry.entry_id]["coordinator"]
+
+
+def _moving() -> VehicleData:
+    """Return ICE telemetry with a fresh GPS fix, driving at 50 km/h."""
+    response = telemetry("ice")
+    metrics = response["metrics"]
+    metrics["position"]["gpsModuleTimestamp"] = dt_util.utcnow().isoformat()
+    metrics["speed"]["value"] = 50.0
+    return parse_api_response(response)
+
+
+async def test_availability_written_without_new_fix(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    coordinator = _coordinator(hass, init_integration)
+    assert hass.states.get(ENTITY_ID).state != STATE_UNAVAILABLE
+
+    coordinator.async_set_update_error(UpdateFailed("Telemetry request failed"))
+    assert hass.states.get(ENTITY_ID).state == STATE_UNAVAILABLE
+
+    coordinator.async_set_updated_data(coordinator.data)
+    assert hass.states.get(ENTITY_ID).state != STATE_UNAVAILABLE
+
+
+async def test_dead_reckoning_stops_when_switched_off(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    coordinator = _coordinator(hass, init_integration)
+    hass.config_entries.async_update_entry(
+        init_integration, options={C.CONF_DEAD_RECKONING: True}
+    )
+    coordinator.async_set_updated_data(_moving())
+    fix = hass.states.get(ENTITY_ID).attributes
+
+    async_fire_time_changed(hass, dt_util.utcnow() + ESTIMATE_INTERVAL)
+    await hass.async_block_till_done()
+    estimate = hass.states.get(ENTITY_ID).attributes
+    assert estimate["estimated"]
+    assert estimate["latitude"] != fix["latitude"]
+
+    hass.config_entries.async_update_entry(
+        init_integration, options={C.CONF_DEAD_RECKONING: False}
+    )
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + 2 * ESTIMATE_INTERVAL)
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_ID).attributes["latitude"] == estimate["latitude"]
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + 3 * ESTIMATE_INTERVAL + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_ID).attributes["latitude"] == estimate["latitude"]
@@ -0,0 +1,84 @@
+"""The integration's import cost."""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import custom_components
+
+PACKAGE = "custom_components.fordconnect"
+# What Home Assistant has imported before it imports the integration: its
+# core and the components the integration depends on.
+BASELINE = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.components.application_credentials",
+    "homeassistant.components.http",
+    "homeassistant.components.recorder",
+)
+# Seconds importing the integration may add to that, its own modules along
+# with the library and Home Assistant modules they bring in. About 19 ms
+# today, most of it building the snapshot records and the telemetry parser.
+IMPORT_BUDGET = 0.05
+RUNS = 3
+# Modules only imported once an entry is set up, or a trace recorded or
+# replayed.
+DEFERRED = ("coordinator", "replay", "statistics", "trips", "tires")
+
+
+def _import_time(cwd: Path) -> tuple[float, list[str]]:
+    """Import the integration after BASELINE in a fresh interpreter.
+
+    Return the seconds the integration's import took, including every
+    module it imported, and the names of those modules.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import {', '.join(BASELINE)}; import {PACKAGE}",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=cwd,
+        env={
+            **os.environ,
+            "PYTHONPATH": str(Path(custom_components.__path__[0]).parent),
+        },
+        text=True,
+    )
+    # Each import is listed after the imports it made, indented below it.
+    imported: list[str] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        if module.strip() == PACKAGE:
+            return int(cumulative) / 1e6, imported
+        if module.startswith("  "):
+            imported.append(module.strip())
+        else:
+            imported = []
+    raise AssertionError(f"{PACKAGE} was not imported")
+
+
+def test_import_time(tmp_path: Path) -> None:
+    """Importing the integration stays within its budget.
+
+    It leaves httpx and the modules only needed for an entry unimported.
+    """
+    # The fastest of a few runs, as the slower ones measure the machine.
+    fastest = None
+    for _ in range(RUNS):
+        seconds, imported = _import_time(tmp_path)
+        assert not any(module.split(".")[0] == "httpx" for module in imported)
+        assert not {f"{PACKAGE}.{name}" for name in DEFERRED} & set(imported)
+        fastest = seconds if fastest is None else min(fastest, seconds)
+    assert fastest is not None
+    assert fastest < IMPORT_BUDGET, f"imported in {fastest * 1000:.1f} ms"
@@ -0,0 +1,78 @@
+"""Parsing telemetry into VehicleData."""
+
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
+
+from conftest import telemetry
+from custom_components.fordconnect.model import (
+    VehicleData,
+    changed_paths,
+    parse_api_response,
+)
+
+
+def test_missing_metrics_only_affect_their_fields() -> None:
+    errors: list[str] = []
+    data = parse_api_response(telemetry("missing"), errors)
+
+    assert errors == [
+        "acceleration",
+        "doors.rear_left.closed",
+        "doors.rear_right.closed",
+        "doors.tailgate.closed",
+        "fuel_range",
+        "heading",
+        "hybrid_vehicle_mode_status",
+        "position",
+        "speed",
+        "battery_load_status",
+        "trip_fuel_economy",
+        "trip_xev_battery_distance_accumulated",
+    ]
+    assert data["position"] is None
+    assert data["doors"]["rear_left"]["closed"] is None
+    assert data["doors"]["front_left"]["closed"] is True
+    assert data["odometer"] is None
+    assert data["ambient_temp"] == 11.5
+
+
+def test_malformed_list_entries() -> None:
+    """An entry that is not an object loses its list, not the whole parse."""
+    response = telemetry("ice")
+    response["metrics"]["doorStatus"].append("CLOSED")
+    response["metrics"]["tirePressure"] = {"value": 2.4}
+    errors: list[str] = []
+    data = parse_api_response(response, errors)
+
+    assert "doors.front_left.closed" in errors
+    assert data["tires"]["front_left"]["pressure"] == 0.0
+    assert data["odometer"] == parse_api_response(telemetry("ice"))["odometer"]
+
+
+def test_snapshot_survives_json() -> None:
+    """A stored snapshot restores equal to the one that was parsed."""
+    data = parse_api_response(telemetry("hybrid"))
+    restored = VehicleData.from_dict(json_loads(json_dumps(data.as_dict())))
+
+    assert restored == data
+    assert restored["tires"]["front_left"] == data["tires"]["front_left"]
+    assert isinstance(restored["position"], tuple)
+    assert not changed_paths(data, restored)
+
+
+def test_changed_paths_between_records() -> None:
+    old = parse_api_response(telemetry("hybrid"))
+    response = telemetry("hybrid")
+    metrics = response["metrics"]
+    metrics["odometer"]["value"] += 1
+    metrics["doorStatus"][0]["value"] = "OPEN"
+    new = parse_api_response(response)
+
+    assert changed_paths(old, new) == {
+        "odometer",
+        "doors",
+        "doors.front_left",
+        "doors.front_left.closed",
+    }
+    assert dict(new["doors"]["front_left"]) == {"closed": False}
+    assert new.get("missing") is None
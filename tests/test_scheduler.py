@@ -0,0 +1,116 @@
+"""Poll phases and jitter across a fleet of entries, simulated."""
+
+from datetime import timedelta
+import heapq
+import random
+
+from conftest import telemetry
+from custom_components.fordconnect.model import VehicleData, parse_api_response
+from custom_components.fordconnect.scheduler import (
+    AdaptivePollScheduler,
+    phase_offset,
+)
+
+ENTRIES = 200
+INTERVAL = timedelta(seconds=15)
+# Seconds one poll keeps a request in flight, and simulated seconds.
+POLL_TIME = 1.0
+DURATION = 3600.0
+BUCKETS = 10
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _simulate(
+    schedulers: list[AdaptivePollScheduler], clock: _Clock, data: VehicleData
+) -> list[tuple[float, int]]:
+    """Run every entry's polls for DURATION; return (time, entry) per poll.
+
+    All entries start together, as after a restart in which each restored
+    its snapshot and so waits for its phase before the first poll.
+    """
+    pending = [
+        (scheduler.first_delay.total_seconds(), entry)
+        for entry, scheduler in enumerate(schedulers)
+    ]
+    heapq.heapify(pending)
+    polls = []
+    while pending[0][0] < DURATION:
+        clock.now, entry = heapq.heappop(pending)
+        polls.append((clock.now, entry))
+        delay = schedulers[entry].next_interval(data).total_seconds()
+        heapq.heappush(pending, (clock.now + delay, entry))
+    return polls
+
+
+def _peak_concurrency(polls: list[tuple[float, int]]) -> int:
+    """Return the most polls in flight at once."""
+    starts = sorted(start for start, _ in polls)
+    peak = 0
+    ending = 0
+    for index, start in enumerate(starts):
+        while starts[ending] + POLL_TIME <= start:
+            ending += 1
+        peak = max(peak, index - ending + 1)
+    return peak
+
+
+def _fleet(phased: bool) -> tuple[list[AdaptivePollScheduler], _Clock]:
+    clock = _Clock()
+    schedulers = []
+    for index in range(ENTRIES):
+        vin = f"WF0XXXTTGXAA{index:05d}"
+        schedulers.append(
+            AdaptivePollScheduler(
+                INTERVAL,
+                INTERVAL,
+                clock=clock,
+                phase=phase_offset(vin) if phased else 0.0,
+                # 0.5 is no jitter at all.
+                jitter=random.Random(vin).random if phased else lambda: 0.5,
+            )
+        )
+    return schedulers, clock
+
+
+def test_phase_offset_is_stable_and_uniform() -> None:
+    vins = [f"WF0XXXTTGXAA{index:05d}" for index in range(ENTRIES)]
+    phases = [phase_offset(vin) for vin in vins]
+    assert phases == [phase_offset(vin) for vin in vins]
+    assert all(0 <= phase < 1 for phase in phases)
+    counts = [0] * BUCKETS
+    for phase in phases:
+        counts[int(phase * BUCKETS)] += 1
+    assert max(counts) < 2 * ENTRIES / BUCKETS
+    assert min(counts) > ENTRIES / BUCKETS / 2
+
+
+def test_polls_spread_over_the_interval() -> None:
+    """A fleet keeps its interval but spreads its requests evenly over it."""
+    data = parse_api_response(telemetry("ice"))
+    schedulers, clock = _fleet(phased=True)
+    polls = _simulate(schedulers, clock, data)
+
+    seconds = INTERVAL.total_seconds()
+    per_entry = [0] * ENTRIES
+    counts = [0] * BUCKETS
+    for when, entry in polls:
+        per_entry[entry] += 1
+        counts[int(when % seconds / seconds * BUCKETS)] += 1
+    # Jitter moves polls around, but does not make them more or less often.
+    expected = DURATION / seconds
+    assert all(abs(count - expected) <= 2 for count in per_entry)
+    assert max(counts) < 1.5 * len(polls) / BUCKETS
+    assert min(counts) > 0.5 * len(polls) / BUCKETS
+
+    # 200 entries polling every 15 s keep about 13 requests in flight on
+    # average; without phases all of them are in flight together.
+    average = ENTRIES * POLL_TIME / seconds
+    assert _peak_concurrency(polls) < 2.5 * average
+    assert _peak_concurrency(_simulate(*_fleet(phased=False), data)) == ENTRIES
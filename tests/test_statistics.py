@@ -0,0 +1,73 @@
+"""Hourly long-term statistics and the sensors they sit next to."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.components.sensor import ATTR_STATE_CLASS, SensorStateClass
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from conftest import VIN, telemetry
+from custom_components.fordconnect.model import parse_api_response
+from custom_components.fordconnect.sensor import METRIC_SENSORS, SENSORS
+from custom_components.fordconnect.statistics import (
+    STATISTICS,
+    StatisticsImporter,
+)
+
+
+def test_one_statistics_source_per_figure() -> None:
+    """Figures with a state class are not also imported as statistics."""
+    with_state_class = {
+        description.key
+        for description in (*SENSORS, *METRIC_SENSORS)
+        if description.state_class is not None
+    }
+    assert {"fuel_level", "fuel_range"} <= with_state_class
+    assert not with_state_class & {description.key for description in STATISTICS}
+
+
+async def test_hour_imported_without_new_readings(hass: HomeAssistant) -> None:
+    """A parked vehicle's last hour is imported once the hour is over."""
+    data = parse_api_response(telemetry("ice"))
+    importer = StatisticsImporter(hass, VIN)
+    unsub = importer.async_start()
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    importer.add(data, hour + timedelta(minutes=10))
+
+    with patch(
+        "custom_components.fordconnect.statistics.async_add_external_statistics"
+    ) as add_statistics:
+        async_fire_time_changed(hass, hour + timedelta(minutes=30))
+        await hass.async_block_till_done()
+        assert not add_statistics.called
+
+        async_fire_time_changed(hass, hour + timedelta(hours=1))
+        await hass.async_block_till_done()
+    unsub()
+
+    rows = {
+        call.args[1]["statistic_id"]: call.args[2][0]
+        for call in add_statistics.call_args_list
+    }
+    assert rows.keys() == {
+        f"fordconnect:{VIN.lower()}_{description.key}"
+        for description in STATISTICS
+        if description.value_fn(data) is not None
+    }
+    odometer = rows[f"fordconnect:{VIN.lower()}_odometer"]
+    assert odometer["start"] == hour
+    assert odometer["sum"] == data["odometer"]
+
+
+async def test_fuel_sensors_keep_state_class(
+    hass: HomeAssistant, init_integration: MockConfigEntry
+) -> None:
+    for key in ("fuel_level", "fuel_range"):
+        state = hass.states.get(f"sensor.vehicle_{VIN.lower()}_{key}")
+        assert state.attributes[ATTR_STATE_CLASS] == SensorStateClass.MEASUREMENT
@@ -0,0 +1,49 @@
+"""Trip detection and the figures of finished trips."""
+
+from dataclasses import replace
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from conftest import telemetry
+from custom_components.fordconnect.model import VehicleData, parse_api_response
+from custom_components.fordconnect.trips import TripLog
+
+
+def _driving(**changes: object) -> VehicleData:
+    data = parse_api_response(telemetry("ice"))
+    return replace(
+        data, **{"ignition_status": "ON", "gear_lever_position": "DRIVE"} | changes
+    )
+
+
+def _parked(**changes: object) -> VehicleData:
+    return _driving(
+        ignition_status="OFF", gear_lever_position="PARK", speed=0.0, **changes
+    )
+
+
+async def test_trip_starting_on_zero_fuel(hass: HomeAssistant) -> None:
+    """A zero fuel reading at the start is missing, as later in the trip."""
+    log = TripLog(hass, "entry")
+    start = dt_util.utcnow()
+    log.add(_driving(fuel_level=0.0, odometer=1000.0), start)
+    log.add(_driving(fuel_level=60.0, odometer=1010.0), start + timedelta(minutes=5))
+    log.add(_driving(fuel_level=58.5, odometer=1030.0), start + timedelta(minutes=20))
+    log.add(_parked(fuel_level=0.0, odometer=1030.0), start + timedelta(minutes=21))
+
+    [trip] = log.recent()
+    assert trip["distance"] == 30.0
+    assert trip["fuel_used"] == 1.5
+
+
+async def test_trip_without_fuel_readings(hass: HomeAssistant) -> None:
+    log = TripLog(hass, "entry")
+    start = dt_util.utcnow()
+    log.add(_driving(fuel_level=0.0), start)
+    log.add(_driving(fuel_level=None), start + timedelta(minutes=5))
+    log.add(_parked(fuel_level=0.0), start + timedelta(minutes=6))
+
+    [trip] = log.recent()
+    assert trip["fuel_used"] is None
@@ -0,0 +1,200 @@
+"""Watch tire pressures for slow leaks and under-inflation.
+
+Each wheel keeps a handful of running figures: an exponentially weighted
+mean and variance of its pressure and a trend in bar per day. Readings are
+normalized to a reference temperature first, so that a cold night does not
+look like a leak. Memory per wheel is constant and the state is persisted,
+so the trend survives restarts.
+"""
+
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from . import const as C
+from .model import VehicleData
+
+TIRES_VERSION = 1
+TIRES_SAVE_DELAY = 300
+
+WHEELS = ("front_left", "front_right", "rear_left", "rear_right")
+
+ATMOSPHERE = 1.01325  # bar
+ZERO_CELSIUS = 273.15
+REFERENCE_TEMPERATURE = 20.0  # °C, roughly what placard pressures assume
+
+# Weight of a new reading in the mean and variance once warmed up; until
+# then every reading counts equally, as in Welford's algorithm.
+SMOOTHING = 0.05
+WARMUP = 10
+# The trend is the change of the mean per day, measured over steps of at
+# least TREND_STEP seconds and smoothed with TREND_SMOOTHING. A leak is only
+# reported after TREND_WARMUP steps, as single steps are dominated by noise.
+TREND_STEP = 6 * 3600
+TREND_SMOOTHING = 0.2
+TREND_WARMUP = 8
+
+LEAK_RATE = 0.05  # bar per day
+PLACARD_TOLERANCE = 0.1  # fraction below placard
+DROP_SIGMAS = 4.0
+MIN_DROP = 0.15  # bar
+
+
+def tires_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's tire monitor state."""
+    return Store(hass, TIRES_VERSION, f"{C.DOMAIN}.{entry_id}.tires")
+
+
+def normalize_pressure(pressure: float, temperature: float | None) -> float:
+    """Convert a gauge pressure to what it would read at the reference.
+
+    The air in a tire has a near constant volume, so its absolute pressure
+    is proportional to its absolute temperature.
+    """
+    if temperature is None:
+        return pressure
+    return (pressure + ATMOSPHERE) * (REFERENCE_TEMPERATURE + ZERO_CELSIUS) / (
+        temperature + ZERO_CELSIUS
+    ) - ATMOSPHERE
+
+
+class WheelMonitor:
+    """Running statistics and anomaly flags for one wheel."""
+
+    __slots__ = (
+        "count",
+        "mean",
+        "variance",
+        "trend",
+        "trend_count",
+        "anchor_time",
+        "anchor_mean",
+        "last",
+        "placard",
+        "status",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.trend = 0.0
+        self.trend_count = 0
+        self.anchor_time = 0.0
+        self.anchor_mean = 0.0
+        self.last = math.nan
+        self.placard = 0.0
+        self.status = ""
+
+    def add(self, pressure: float, when: float) -> None:
+        self.last = pressure
+        self.count += 1
+        if self.count == 1:
+            self.mean = pressure
+            self.anchor_time = when
+            self.anchor_mean = pressure
+            return
+
+        weight = max(SMOOTHING, 1 / self.count)
+        diff = pressure - self.mean
+        increment = weight * diff
+        self.mean += increment
+        self.variance = (1 - weight) * (self.variance + diff * increment)
+
+        elapsed = when - self.anchor_time
+        if elapsed >= TREND_STEP:
+            slope = (self.mean - self.anchor_mean) / (elapsed / 86400)
+            if self.trend_count == 0:
+                self.trend = slope
+            else:
+                self.trend += TREND_SMOOTHING * (slope - self.trend)
+            self.trend_count += 1
+            self.anchor_time = when
+            self.anchor_mean = self.mean
+
+    @property
+    def problems(self) -> list[str]:
+        problems: list[str] = []
+        if self.status and self.status != "NORMAL":
+            problems.append("vehicle_warning")
+        if self.count == 0:
+            return problems
+        if self.trend_count >= TREND_WARMUP and self.trend <= -LEAK_RATE:
+            problems.append("slow_leak")
+        if self.placard > 0 and self.mean < self.placard * (1 - PLACARD_TOLERANCE):
+            problems.append("below_placard")
+        if self.count >= WARMUP and self.mean - self.last > max(
+            DROP_SIGMAS * math.sqrt(self.variance), MIN_DROP
+        ):
+            problems.append("sudden_drop")
+        return problems
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "pressure_normalized": None if math.isnan(self.last) else self.last,
+            "mean": self.mean if self.count else None,
+            "std_dev": math.sqrt(self.variance) if self.count else None,
+            "trend_per_day": self.trend if self.trend_count else None,
+            "placard_pressure": self.placard or None,
+            "vehicle_status": self.status or None,
+            "problems": self.problems,
+        }
+
+    def state(self) -> list[Any]:
+        return [
+            None if isinstance(value, float) and math.isnan(value) else value
+            for value in (getattr(self, name) for name in self.__slots__)
+        ]
+
+    @classmethod
+    def from_state(cls, state: list[Any]) -> "WheelMonitor":
+        monitor = cls()
+        for name, value in zip(cls.__slots__, state, strict=True):
+            setattr(monitor, name, math.nan if value is None else value)
+        return monitor
+
+
+class TireMonitor:
+    """Per-wheel monitors fed from every new telemetry snapshot."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = tires_store(hass, entry_id)
+        self.wheels = {wheel: WheelMonitor() for wheel in WHEELS}
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for wheel, state in stored["wheels"].items():
+            if wheel in self.wheels:
+                self.wheels[wheel] = WheelMonitor.from_state(state)
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        return {
+            "wheels": {wheel: monitor.state() for wheel, monitor in self.wheels.items()}
+        }
+
+    @callback
+    def add(self, data: VehicleData, when: float) -> None:
+        temperature = data["outside_temperature"]
+        if temperature is None:
+            temperature = data["ambient_temp"]
+        changed = False
+        for wheel, monitor in self.wheels.items():
+            tire = data["tires"][wheel]
+            monitor.status = tire["status"]
+            if tire["placard_pressure"]:
+                monitor.placard = tire["placard_pressure"]
+            # 0.0 is what the parser leaves for a missing reading.
+            if not tire["pressure"]:
+                continue
+            pressure = normalize_pressure(tire["pressure"], temperature)
+            if pressure == monitor.last:
+                continue
+            monitor.add(pressure, when)
+            changed = True
+        if changed:
+            self._store.async_delay_save(self._data_to_store, TIRES_SAVE_DELAY)
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+
+from homeassistant.const import CONF_ACCESS_TOKEN, CONF_TOKEN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+from homeassistant.helpers.event import async_call_later
+
+from .api import FordAPI
+from .metrics import RollingHistogram
+
+LOGGER = logging.getLogger(__name__)
+
+REFRESH_AHEAD = 300
+RETRY_DELAY = 60
+
+
+class TokenManager:
+    """Refresh the OAuth token in the background, ahead of its expiry.
+
+    All refresh requests, whether from the timer or from a poll that found
+    the token expired, share a single in-flight call to the token endpoint.
+    Every new access token is handed to the FordAPI client straight away.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: OAuth2Session,
+        api: FordAPI,
+        phase: float = 0.0,
+    ) -> None:
+        self._hass = hass
+        # Between one and two REFRESH_AHEAD before expiry, so entries whose
+        # tokens were issued together do not all refresh at once.
+        self._refresh_ahead = REFRESH_AHEAD * (1 + phase)
+        self._session = session
+        self._api = api
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._stopped = False
+        self.refresh_count = 0
+        self.refresh_time = RollingHistogram()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Schedule the first refresh; return a callback that stops it."""
+        self._schedule(self._session.token["expires_at"] - self._refresh_ahead)
+        return self._async_stop
+
+    @callback
+    def _async_stop(self) -> None:
+        self._stopped = True
+        self._cancel_timer()
+
+    @callback
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def async_ensure_token_valid(self) -> None:
+        """Make sure the API client holds a valid token, refreshing if needed."""
+        if not self._session.valid_token:
+            await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        if self._refresh_task is None:
+            self._refresh_task = self._hass.async_create_task(self._async_refresh())
+        # Shielded so a cancelled caller does not cancel the shared refresh.
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh(self) -> None:
+        entry = self._session.config_entry
+        started = time.perf_counter()
+        try:
+            token = await self._session.implementation.async_refresh_token(
+                self._session.token
+            )
+        except Exception:
+            self._schedule(time.time() + RETRY_DELAY)
+            raise
+        finally:
+            self._refresh_task = None
+
+        self.refresh_count += 1
+        self.refresh_time.add(time.perf_counter() - started)
+        self._hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_TOKEN: token}
+        )
+        self._api.set_access_token(token[CONF_ACCESS_TOKEN])
+        self._schedule(token["expires_at"] - self._refresh_ahead)
+
+    @callback
+    def _schedule(self, refresh_at: float) -> None:
+        self._cancel_timer()
+        if self._stopped:
+            return
+        self._unsub_timer = async_call_later(
+            self._hass, max(0.0, refresh_at - time.time()), self._handle_timer
+        )
+
+    @callback
+    def _handle_timer(self, _now: object) -> None:
+        self._unsub_timer = None
+        self._hass.async_create_background_task(
+            self._async_background_refresh(), "fordconnect token refresh"
+        )
+
+    async def _async_background_refresh(self) -> None:
+        try:
+            await self.async_refresh()
+        except Exception:  # noqa: BLE001
+            LOGGER.warning(
+                "Background token refresh failed, retrying in %d s",
+                RETRY_DELAY,
+                exc_info=True,
+            )
@@ -0,0 +1,209 @@
+"""Detect trips from successive telemetry snapshots and keep a trip log.
+
+A trip starts when the ignition is switched on or the vehicle leaves park,
+and ends once it is both switched off and parked again. Each poll only
+updates a handful of running aggregates, so the cost per poll does not
+depend on the length of the trip or of the log. Finished trips are stored
+as fixed rows of numbers.
+"""
+
+from collections import deque
+from datetime import datetime
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from . import const as C
+from .model import VehicleData
+from .scheduler import is_vehicle_active
+
+TRIPS_VERSION = 1
+TRIPS_SAVE_DELAY = 30
+DEFAULT_CAPACITY = 10_000
+
+# Columns of a stored trip. Times are Unix timestamps, distances km and fuel
+# percentage points of the tank; None marks a figure the vehicle did not
+# report.
+FIELDS = (
+    "start",
+    "end",
+    "distance",
+    "fuel_used",
+    "ev_distance",
+    "max_speed",
+    "fuel_economy",
+)
+
+
+def trips_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's trip log."""
+    return Store(hass, TRIPS_VERSION, f"{C.DOMAIN}.{entry_id}.trips")
+
+
+def _number(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _trip_value(value: tuple[str, float] | None) -> float:
+    return math.nan if value is None else float(value[1])
+
+
+def _stored(values: list[float]) -> list[float | None]:
+    """NaN does not survive JSON; store it as None."""
+    return [None if math.isnan(value) else value for value in values]
+
+
+class _Trip:
+    """Running aggregates of the trip in progress."""
+
+    __slots__ = (
+        "start",
+        "end",
+        "start_odometer",
+        "odometer",
+        "start_fuel",
+        "fuel",
+        "ev_distance",
+        "max_speed",
+        "fuel_economy",
+    )
+
+    def __init__(self, data: VehicleData, when: float) -> None:
+        self.start = self.end = when
+        # update() takes the first readings it accepts as the start.
+        self.start_odometer = self.odometer = math.nan
+        self.start_fuel = self.fuel = math.nan
+        self.ev_distance = math.nan
+        self.max_speed = 0.0
+        self.fuel_economy = math.nan
+        self.update(data, when)
+
+    def update(self, data: VehicleData, when: float) -> None:
+        self.end = when
+        if (odometer := data["odometer"]) is not None:
+            if math.isnan(self.start_odometer):
+                self.start_odometer = odometer
+            self.odometer = odometer
+        if (fuel := data["fuel_level"]) is not None and fuel > 0:
+            # Fuel reads zero while the vehicle is off; see sensor.py.
+            if math.isnan(self.start_fuel):
+                self.start_fuel = fuel
+            self.fuel = fuel
+        self.max_speed = max(self.max_speed, data["speed"] or 0.0)
+        # The vehicle keeps its own per-trip figures; the latest one is the
+        # figure for the whole trip.
+        if data["trip_fuel_economy"] is not None:
+            self.fuel_economy = _trip_value(data["trip_fuel_economy"])
+        if data["trip_xev_battery_distance_accumulated"] is not None:
+            self.ev_distance = _trip_value(
+                data["trip_xev_battery_distance_accumulated"]
+            )
+
+    def row(self) -> list[float | None]:
+        # A refuel during the trip is not fuel used. Without a fuel reading
+        # it stays NaN, stored as None.
+        fuel_used = self.start_fuel - self.fuel
+        if fuel_used < 0.0:
+            fuel_used = 0.0
+        return _stored(
+            [
+                self.start,
+                self.end,
+                self.odometer - self.start_odometer,
+                fuel_used,
+                self.ev_distance,
+                self.max_speed,
+                self.fuel_economy,
+            ]
+        )
+
+    def state(self) -> list[float | None]:
+        return _stored([getattr(self, name) for name in self.__slots__])
+
+    @classmethod
+    def from_state(cls, state: list[float | None]) -> "_Trip":
+        trip = cls.__new__(cls)
+        for name, value in zip(cls.__slots__, state, strict=True):
+            setattr(trip, name, _number(value))
+        return trip
+
+
+def trip_as_dict(row: list[float | None]) -> dict[str, Any]:
+    trip: dict[str, Any] = dict(zip(FIELDS, row, strict=True))
+    duration = trip["end"] - trip["start"]
+    distance = trip["distance"]
+    ev_distance = trip["ev_distance"]
+    trip["start"] = dt_util.utc_from_timestamp(trip["start"]).isoformat()
+    trip["end"] = dt_util.utc_from_timestamp(trip["end"]).isoformat()
+    trip["duration"] = duration
+    trip["average_speed"] = (
+        distance / duration * 3600 if distance is not None and duration > 0 else None
+    )
+    trip["ev_share"] = (
+        min(1.0, ev_distance / distance)
+        if ev_distance is not None and distance
+        else None
+    )
+    return trip
+
+
+class TripLog:
+    """Trip detection plus a bounded, persisted log of finished trips."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        self._store = trips_store(hass, entry_id)
+        self._trips: deque[list[float | None]] = deque(maxlen=capacity)
+        self.current: _Trip | None = None
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self._trips.extend(stored["trips"])
+        if stored["current"] is not None:
+            self.current = _Trip.from_state(stored["current"])
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        return {
+            "trips": list(self._trips),
+            "current": self.current.state() if self.current else None,
+        }
+
+    @callback
+    def add(self, data: VehicleData, when: datetime) -> None:
+        """Feed a new snapshot; finishes the current trip when it ends.
+
+        The log is only saved when a trip starts or finishes. After a
+        restart in the middle of a trip, the next poll brings the running
+        figures up to date again.
+        """
+        timestamp = when.timestamp()
+        if is_vehicle_active(data):
+            if self.current is not None:
+                self.current.update(data, timestamp)
+                return
+            self.current = _Trip(data, timestamp)
+        elif self.current is not None:
+            self.current.update(data, timestamp)
+            self._trips.append(self.current.row())
+            self.current = None
+        else:
+            return
+        self._store.async_delay_save(self._data_to_store, TRIPS_SAVE_DELAY)
+
+    def recent(
+        self, limit: int | None = None, since: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the newest finished trips, oldest first."""
+        count = len(self._trips) if limit is None else min(limit, len(self._trips))
+        return [
+            trip_as_dict(row)
+            for row in list(self._trips)[len(self._trips) - count :]
+            if since is None or row[1] >= since
+        ]
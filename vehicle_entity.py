@@ -8,13 +8,30 @@ from . import const as C
 
 
 class VehicleEntity(CoordinatorEntity[MyDataCoordinator]):
+    # Key paths into VehicleData this entity reads; the coordinator only
+    # wakes the entity when one of them changes. Empty means always.
+    _data_paths: tuple[str, ...] = ()
+
     def __init__(
         self, coordinator: MyDataCoordinator, entry: ConfigEntry
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=self._data_paths or None)
 
         self._entry = entry
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Show last-known values straight away, e.g. from the snapshot the
+        # coordinator restored at startup, instead of waiting for a poll.
+        if self.coordinator.data is not None:
+            self._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        # Restored data stands in until the first poll. After that, any
+        # data, restored or polled, is unavailable while polls fail.
+        return super().available or self.coordinator.restored
+
     @property
     def unique_id(self) -> str | None:
         return f"{self.config_entry.entry_id}_{self._attr_name}"